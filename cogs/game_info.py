@@ -143,14 +143,11 @@ class GameInfo(commands.Cog):
     @commands.command(name="character_talent")
     async def character_talent(self, ctx, *, character_name: str):
         """Show talent tree for a specific character."""
-        # Get character information
-        character = self.data_parser.get_character(character_name)
-        
-        # Get talent type information
-        talent_type_info = self.data_parser.get_talent_type_info(character_name)
-        
-        # Get talent tree images
-        talent_images = self.data_parser.get_talent_tree_images(character_name)
+        # Get character information, talent type and talent tree images
+        bundle = self.data_parser.get_character_bundle(character_name)
+        character = bundle['character']
+        talent_type_info = bundle['talent_type']
+        talent_images = bundle['images']
         
         if not talent_images:
             embed = EmbedGenerator.create_error_embed(
@@ -357,7 +357,7 @@ class PlayerSystem(commands.Cog):
         
         resources = global_profile_manager.get_resources(user_id)
         skills = global_profile_manager.get_skills(user_id)
-        skill_progress = skill_manager.get_skill_tree_progress(skills)
+        skill_progress = skill_manager.get_skill_tree_progress(skills, verbose=False)
         
         # Calculate total hero power
         profile = global_profile_manager.load_global_profile(user_id)
@@ -87,6 +87,9 @@ class AvatarRealmsBot(commands.Bot):
         """Optimized setup hook called when the bot is starting up."""
         self.logger.info("🚀 Setting up bot with optimizations...")
         
+        # Batch invite writes instead of saving on every change
+        self.invite_manager.start_flush_task()
+        
         # Load all cogs with performance tracking
         cog_files = [
             'cogs.talent_trees',
@@ -145,6 +148,11 @@ class AvatarRealmsBot(commands.Bot):
         except Exception as e:
             self.logger.error(f"❌ Failed to load webhook handler: {e}")
     
+    async def close(self):
+        """Flush pending data before shutting down."""
+        self.invite_manager.flush()
+        await super().close()
+    
     async def on_ready(self):
         """Optimized ready event with enhanced logging."""
         startup_time = time.time() - self.start_time
@@ -175,9 +183,6 @@ class AvatarRealmsBot(commands.Bot):
             name="Master all four elements!"
         )
         await self.change_presence(activity=activity)
-        
-        # Clean up any invalid invites
-        await self.invite_manager.cleanup_invalid_invites()
 
     async def on_app_command_error(self, interaction: discord.Interaction, error: Exception):
         """Global error handler for slash commands with professional embeds and reduced spam."""
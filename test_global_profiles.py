@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite-backed global profile store.
+Every manager is built over a temporary data directory so no real profile data is touched.
+"""
+
+import importlib
+import json
+import pytest
+
+
+@pytest.fixture
+def profile_module(tmp_path, monkeypatch):
+    """Import the profile manager module."""
+    # The module-level singleton uses cwd-relative paths; keep it out of the repo
+    # in case this is the first import of the session
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("utils.global_profile_manager")
+
+@pytest.fixture
+def users_dir(tmp_path):
+    """Temporary data directory for the managers under test."""
+    return tmp_path / "users"
+
+@pytest.fixture
+def make_manager(profile_module, users_dir):
+    """Build fresh managers over the temporary data directory and close them afterwards."""
+    managers = []
+    
+    def make():
+        manager = profile_module.GlobalProfileManager(base_dir=users_dir)
+        managers.append(manager)
+        return manager
+    
+    yield make
+    for manager in managers:
+        manager.close()
+
+def write_legacy_profiles(profiles_dir, profiles):
+    """Write legacy per-user JSON profile files."""
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in profiles.items():
+        (profiles_dir / name).write_text(content, encoding='utf-8')
+
+def test_legacy_json_profiles_are_imported(users_dir, make_manager):
+    """Readable legacy files are imported and unreadable ones are skipped."""
+    write_legacy_profiles(users_dir / "global_profiles", {
+        "111.json": json.dumps({"user_id": 111, "resources": {"skill_points": 3}}),
+        "222.json": json.dumps({"resources": {"skill_points": 5}}),
+        "333.json": "{not json",
+        "444.json": "[]",
+        "not-a-user.json": json.dumps({"resources": {}}),
+        "notes.txt": "ignored"
+    })
+    
+    manager = make_manager()
+    
+    assert manager.count_profiles() == 2
+    assert manager.load_global_profile(111)["resources"]["skill_points"] == 3
+    # The user ID falls back to the file name when the profile has none
+    assert manager.load_global_profile(222)["resources"]["skill_points"] == 5
+    assert manager.get_profile_blob(333) is None
+    assert manager.get_profile_blob(444) is None
+
+def test_save_then_load_round_trips(make_manager):
+    """A saved profile is returned unchanged by a fresh manager."""
+    manager = make_manager()
+    profile = manager.load_global_profile(888)
+    profile["resources"]["epic_hero_shards"] = 7
+    profile["preferences"]["display_name"] = "Toph"
+    manager.save_global_profile(888, profile)
+    
+    loaded = make_manager().load_global_profile(888)
+    
+    assert loaded == profile
+    assert loaded["resources"]["epic_hero_shards"] == 7
+    assert loaded["preferences"]["display_name"] == "Toph"
+
+def test_unchanged_save_is_skipped(make_manager):
+    """Saving identical content again does not rewrite the row."""
+    manager = make_manager()
+    profile = manager.load_global_profile(555)
+    profile["resources"]["basic_hero_shards"] = 12
+    manager.save_global_profile(555, profile)
+    first_blob = manager.get_profile_blob(555)
+    first_updated = profile["last_updated"]
+    
+    manager.save_global_profile(555, profile)
+    
+    assert manager.get_profile_blob(555) == first_blob
+    assert profile["last_updated"] == first_updated
+    
+    # A real change is still written
+    profile["resources"]["basic_hero_shards"] = 13
+    manager.save_global_profile(555, profile)
+    assert manager.get_profile_blob(555) != first_blob
+    assert make_manager().load_global_profile(555)["resources"]["basic_hero_shards"] == 13
+
+def test_import_runs_only_once(users_dir, make_manager):
+    """Legacy files are not imported again after the first start."""
+    profiles_dir = users_dir / "global_profiles"
+    write_legacy_profiles(profiles_dir, {"666.json": json.dumps({"user_id": 666})})
+    manager = make_manager()
+    assert manager.count_profiles() == 1
+    
+    # Edit an imported profile, then add and change legacy files
+    profile = manager.load_global_profile(666)
+    profile["resources"] = {"skill_points": 9}
+    manager.save_global_profile(666, profile)
+    write_legacy_profiles(profiles_dir, {
+        "666.json": json.dumps({"user_id": 666, "resources": {"skill_points": 0}}),
+        "777.json": json.dumps({"user_id": 777})
+    })
+    
+    reopened = make_manager()
+    
+    assert reopened.count_profiles() == 1
+    assert reopened.get_profile_blob(777) is None
+    assert reopened.load_global_profile(666)["resources"]["skill_points"] == 9
+
+def test_import_is_not_retried_into_an_empty_table(users_dir, make_manager):
+    """A completed import with no legacy files does not rescan on later starts."""
+    make_manager()
+    write_legacy_profiles(users_dir / "global_profiles", {"999.json": json.dumps({"user_id": 999})})
+    
+    reopened = make_manager()
+    
+    assert reopened.count_profiles() == 0
@@ -234,9 +234,7 @@ class DataMigrationManager:
                         status["minigame_users"] += len(list(players_dir.glob("*.json")))
         
         # Count existing global profiles
-        global_profiles_dir = Path("data/users/global_profiles")
-        if global_profiles_dir.exists():
-            status["global_profiles_exist"] = len(list(global_profiles_dir.glob("*.json")))
+        status["global_profiles_exist"] = global_profile_manager.count_profiles()
         
         # Simple heuristic: if we have global profiles equal to or greater than
         # the sum of unique users from both systems, migration might be complete
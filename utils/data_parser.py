@@ -5,11 +5,15 @@ Data parser utility for loading and parsing game data from JSON files.
 import json
 import os
 import logging
+from operator import itemgetter
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Display order for character rarities (Legendary first); unknown rarities sort with Rare
+RARITY_SORT_ORDER = {"Legendary": 1, "Epic": 2, "Rare": 3}
+
 class DataParser:
     """Utility class for parsing game data from JSON files."""
     
@@ -30,6 +34,15 @@ class DataParser:
         self._characters_cache = {}
         self._events_cache = {}
         self._character_list_cache = None
+        self._skill_priorities_cache = None
+        self._talent_data_cache = None
+        self._talent_tree_images_cache = {}
+        self._character_bundle_cache = {}
+        self._characters_by_element = None
+        self._characters_by_element_rarity = None
+        self._skill_priority_names = None
+        self._skill_priority_by_element = None
+        self._skill_priority_by_element_rarity = None
         
     def load_json_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """
@@ -65,15 +78,31 @@ class DataParser:
         Returns:
             Dictionary with character names as keys and skill priority data as values
         """
+        if self._skill_priorities_cache is not None:
+            return self._skill_priorities_cache
+        
         skill_priorities_file = self.skill_priorities_dir / "skill_priorities.json"
         skill_data = self.load_json_file(skill_priorities_file)
         
         if skill_data and 'skill_priorities' in skill_data:
-            return skill_data['skill_priorities']
+            self._skill_priorities_cache = skill_data['skill_priorities']
+            return self._skill_priorities_cache
         
-        # Fallback to empty dict if file not found
+        # Fallback to empty dict if file not found; cached so callers stay warm instead of retrying
         logger.warning("Skill priorities file not found, returning empty dict")
-        return {}
+        self._skill_priorities_cache = {}
+        return self._skill_priorities_cache
+    
+    def get_skill_priority_names(self) -> set:
+        """
+        Get the names of characters that have skill priority data.
+        
+        Returns:
+            Set of character names
+        """
+        if self._skill_priority_names is None:
+            self._build_indexes()
+        return self._skill_priority_names
     
     def get_character_list(self) -> List[Dict[str, Any]]:
         """
@@ -127,6 +156,86 @@ class DataParser:
         self._character_list_cache = avatar_characters
         return self._character_list_cache
     
+    def is_warm(self) -> bool:
+        """
+        Check whether the lookup indexes used by interaction callbacks are built.
+        
+        Returns:
+            True if element and skill priority lookups will not touch disk
+        """
+        # The indexes imply a cached character list; skill priorities are cached separately
+        return self._characters_by_element is not None and self._skill_priorities_cache is not None
+    
+    def warm_indexes(self):
+        """Build the element and skill priority lookup indexes if they are not cached."""
+        if not self.is_warm():
+            self._build_indexes()
+    
+    def _build_indexes(self):
+        """Build every derived character index in a single pass over the catalog."""
+        skill_priority_names = set(self.get_skill_priorities())
+        
+        by_element = {}
+        ranked_by_element = {}
+        for char in self.get_character_list():
+            key = char.get('element', '').lower()
+            by_element.setdefault(key, []).append(char)
+            # Resolve the rarity rank once per character; the dicts themselves stay untouched
+            rank = RARITY_SORT_ORDER.get(char.get('rarity', 'Rare'), 3)
+            ranked_by_element.setdefault(key, []).append((rank, char))
+        
+        by_element_rarity = {
+            key: [char for _, char in sorted(ranked, key=itemgetter(0))]
+            for key, ranked in ranked_by_element.items()
+        }
+        
+        self._skill_priority_names = skill_priority_names
+        self._skill_priority_by_element = {
+            key: [char for char in chars if char['name'] in skill_priority_names]
+            for key, chars in by_element.items()
+        }
+        self._skill_priority_by_element_rarity = {
+            key: [char for char in chars if char['name'] in skill_priority_names]
+            for key, chars in by_element_rarity.items()
+        }
+        self._characters_by_element_rarity = by_element_rarity
+        # Set last: is_warm() keys off this index
+        self._characters_by_element = by_element
+    
+    def get_characters_by_element(self, element: str, by_rarity: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all characters of an element.
+        
+        Args:
+            element: Element name (case-insensitive)
+            by_rarity: Sort by rarity (Legendary first) instead of catalog order
+            
+        Returns:
+            List of character dictionaries
+        """
+        if self._characters_by_element is None:
+            self._build_indexes()
+        
+        index = self._characters_by_element_rarity if by_rarity else self._characters_by_element
+        return index.get(element.lower(), [])
+    
+    def get_skill_priority_heroes_by_element(self, element: str, by_rarity: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the characters of an element that have skill priority data.
+        
+        Args:
+            element: Element name (case-insensitive)
+            by_rarity: Sort by rarity (Legendary first) instead of catalog order
+            
+        Returns:
+            List of character dictionaries
+        """
+        if self._characters_by_element is None:
+            self._build_indexes()
+        
+        index = self._skill_priority_by_element_rarity if by_rarity else self._skill_priority_by_element
+        return index.get(element.lower(), [])
+    
     def get_character(self, character_name: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific character.
@@ -183,6 +292,17 @@ class DataParser:
             return character['talents']
         return None
 
+    def _get_talent_data(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed talent types file, loading it on first use.
+        
+        Returns:
+            Talent data dictionary or None if it could not be loaded
+        """
+        if self._talent_data_cache is None:
+            self._talent_data_cache = self.load_json_file(self.talent_data_dir / "talent_types.json")
+        return self._talent_data_cache
+    
     def get_talent_type_info(self, character_name: str) -> Optional[Dict[str, Any]]:
         """
         Get talent type information for a specific character.
@@ -194,8 +314,7 @@ class DataParser:
             Talent type information or None if not found
         """
         try:
-            talent_types_file = self.talent_data_dir / "talent_types.json"
-            talent_data = self.load_json_file(talent_types_file)
+            talent_data = self._get_talent_data()
             
             if not talent_data or 'talent_types' not in talent_data:
                 return None
@@ -236,8 +355,7 @@ class DataParser:
             Dictionary with talent tree categories and metadata
         """
         try:
-            talent_types_file = self.talent_data_dir / "talent_types.json"
-            talent_data = self.load_json_file(talent_types_file)
+            talent_data = self._get_talent_data()
             
             if talent_data and 'tree_categories' in talent_data:
                 return {
@@ -308,6 +426,10 @@ class DataParser:
             if not file_name:
                 return None
             
+            # Reuse the result of an earlier directory scan
+            if file_name in self._talent_tree_images_cache:
+                return self._talent_tree_images_cache[file_name]
+            
             # Look for both -1 and -2 versions of the talent tree
             image_1 = None
             image_2 = None
@@ -319,18 +441,43 @@ class DataParser:
                 elif filename == f"{file_name}-2":
                     image_2 = str(file_path)
             
+            images = None
             if image_1 or image_2:
-                return {
+                images = {
                     'talent_tree_1': image_1,
                     'talent_tree_2': image_2
                 }
             
-            return None
+            self._talent_tree_images_cache[file_name] = images
+            return images
             
         except Exception as e:
             print(f"Error getting talent tree images: {e}")
             return None
 
+    def get_character_bundle(self, character_name: str) -> Dict[str, Any]:
+        """
+        Get a character's record, talent type and talent tree images in one call.
+        
+        Bundles are cached per name until clear_cache, so callers can compare them by
+        identity to tell whether the underlying data was reloaded.
+        
+        Args:
+            character_name: Name of the character
+            
+        Returns:
+            Dictionary with 'character', 'talent_type' and 'images' entries (each may be None)
+        """
+        bundle = self._character_bundle_cache.get(character_name)
+        if bundle is None:
+            bundle = {
+                'character': self.get_character(character_name),
+                'talent_type': self.get_talent_type_info(character_name),
+                'images': self.get_talent_tree_images(character_name)
+            }
+            self._character_bundle_cache[character_name] = bundle
+        return bundle
+    
     def get_all_character_names(self) -> List[str]:
         """
         Get all available character names for dropdown.
@@ -453,6 +600,15 @@ class DataParser:
         self._characters_cache.clear()
         self._events_cache.clear()
         self._character_list_cache = None
+        self._skill_priorities_cache = None
+        self._talent_data_cache = None
+        self._talent_tree_images_cache.clear()
+        self._character_bundle_cache.clear()
+        self._characters_by_element = None
+        self._characters_by_element_rarity = None
+        self._skill_priority_names = None
+        self._skill_priority_by_element = None
+        self._skill_priority_by_element_rarity = None
         logger.info("Data cache cleared")
     
     def reload_data(self):
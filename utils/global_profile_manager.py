@@ -3,25 +3,119 @@ Global Profile Manager for Avatar Realms Collide Discord Bot.
 Handles global user profiles, cross-server statistics, and leaderboard caching.
 """
 
+import copy
+import hashlib
 import json
+import heapq
+import math
+import os
+import sqlite3
+import time
 import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Mapping, Collection, Union
 from collections import defaultdict
+from functools import lru_cache, reduce
+from itertools import islice
+from operator import itemgetter
 import logging
 from .player_manager import player_manager
 from .skill_manager import skill_manager
 from .rating_system import rating_system
+from .data_handlers.cache_handler import CacheHandler
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only fallback for missing profile sections
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Templates for new profile sections; always copy before handing out
+_DEFAULT_RESOURCES = {
+    "basic_hero_shards": 0,
+    "epic_hero_shards": 0,
+    "skill_points": 0
+}
+
+_DEFAULT_DUEL_STATS = {
+    "total_duels": 0,
+    "duel_wins": 0,
+    "duel_losses": 0,
+    "duel_draws": 0,
+    "win_rate": 0.0,
+    "current_streak": 0,
+    "best_streak": 0,
+    "duel_rating": 1000,
+    "total_damage_dealt": 0,
+    "total_damage_taken": 0,
+    "favorite_element": None,
+    "element_totals": {"fire": 0, "water": 0, "earth": 0, "air": 0},
+    "element_stats": {
+        "fire": {"wins": 0, "losses": 0, "draws": 0},
+        "water": {"wins": 0, "losses": 0, "draws": 0},
+        "earth": {"wins": 0, "losses": 0, "draws": 0},
+        "air": {"wins": 0, "losses": 0, "draws": 0}
+    },
+    "recent_duels": [],
+    "achievements": [],
+    "last_duel_at": None
+}
+
+# Duel achievements as (id, path into duel_stats, minimum value)
+_DUEL_ACHIEVEMENTS = (
+    ("first_blood", ("duel_wins",), 1),
+    ("dueling_novice", ("total_duels",), 10),
+    ("dueling_veteran", ("total_duels",), 50),
+    ("dueling_master", ("total_duels",), 100),
+    ("unstoppable", ("best_streak",), 5),
+    ("dominator", ("best_streak",), 10),
+    ("legend", ("best_streak",), 15),
+    ("element_master_fire", ("element_stats", "fire", "wins"), 10),
+    ("element_master_water", ("element_stats", "water", "wins"), 10),
+    ("element_master_earth", ("element_stats", "earth", "wins"), 10),
+    ("element_master_air", ("element_stats", "air", "wins"), 10),
+    ("silver_rank", ("duel_rating",), 1200),
+    ("gold_rank", ("duel_rating",), 1400),
+    ("platinum_rank", ("duel_rating",), 1600),
+    ("diamond_rank", ("duel_rating",), 1800),
+    ("master_rank", ("duel_rating",), 2000),
+)
+
+# Sort keys for each duel leaderboard category (all descending)
+_DUEL_SORT_KEYS = {
+    "rating": itemgetter("duel_rating"),
+    "wins": itemgetter("duel_wins"),
+    "win_rate": itemgetter("win_rate", "total_duels"),
+    "streak": itemgetter("best_streak")
+}
+
+# Profile database user_version once the legacy JSON profiles have been imported
+_LEGACY_IMPORT_DONE = 1
+
+@lru_cache(maxsize=4096)
+def _global_level(total_xp: int) -> int:
+    """Memoized global level for a total XP value."""
+    if total_xp <= 0:
+        return 1
+    
+    # XP curve: level = floor(sqrt(total_xp / 100)) + 1
+    # This means: Level 1: 0-99 XP, Level 2: 100-399 XP, Level 3: 400-899 XP, etc.
+    return int(math.sqrt(total_xp / 100)) + 1
+
 class GlobalProfileManager:
     """Manages global user profiles and cross-server statistics."""
     
-    def __init__(self):
-        self.global_profiles_dir = Path("data/users/global_profiles")
-        self.leaderboard_cache_dir = Path("data/users/leaderboards")
+    def __init__(self, base_dir: Union[str, Path] = "data/users"):
+        # Resolved once so later working directory changes cannot split files across locations
+        base_dir = Path(base_dir).resolve()
+        self.global_profiles_dir = base_dir / "global_profiles"
+        self.leaderboard_cache_dir = base_dir / "leaderboards"
         self.server_rankings_dir = self.leaderboard_cache_dir / "server_rankings"
         
         # Ensure directories exist
@@ -29,17 +123,125 @@ class GlobalProfileManager:
         self.leaderboard_cache_dir.mkdir(parents=True, exist_ok=True)
         self.server_rankings_dir.mkdir(parents=True, exist_ok=True)
         
-        # Cache for loaded profiles
-        self._profile_cache = {}
+        # Bounded LRU cache for loaded profiles; entries expire individually
         self._cache_timeout = 300  # 5 minutes
-        self._last_cache_clear = datetime.now(timezone.utc)
+        self._profile_cache = CacheHandler(max_size=2000, default_ttl=self._cache_timeout)
+        
+        # Digest of each profile's last written content (minus last_updated)
+        self._profile_digests: Dict[int, bytes] = {}
+        
+        # Global and duel leaderboard entries keyed by user ID, maintained on save
+        self._global_entries: Optional[Dict[int, Dict[str, Any]]] = None
+        self._duel_entries: Optional[Dict[int, Dict[str, Any]]] = None
+        
+        # Short-lived duel leaderboard results keyed by (limit, category)
+        self._duel_leaderboard_ttl = 15  # seconds
+        self._duel_leaderboard_cache: Dict[Tuple[int, str], Tuple[float, List[Dict[str, Any]]]] = {}
+        
+        # Profiles are stored as JSON blobs in SQLite (WAL for concurrent readers)
+        self.profiles_db_path = base_dir / "profiles.db"
+        self._db = sqlite3.connect(str(self.profiles_db_path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS profiles (user_id INTEGER PRIMARY KEY, blob BLOB NOT NULL)"
+        )
+        
+        # One-shot import of legacy per-user JSON files, recorded in the database's user_version
+        if self._db.execute("PRAGMA user_version").fetchone()[0] < _LEGACY_IMPORT_DONE:
+            if self.count_profiles() == 0:
+                self.import_json_profiles()
+            else:
+                # Databases created before the marker existed were imported on their first start
+                self._db.execute(f"PRAGMA user_version = {_LEGACY_IMPORT_DONE}")
+    
+    def close(self):
+        """Close the profile database connection."""
+        self._db.close()
+    
+    def get_profile_blob(self, user_id: int) -> Optional[bytes]:
+        """Return a profile's stored serialized form, or None if it is not stored."""
+        row = self._db.execute("SELECT blob FROM profiles WHERE user_id = ?", (user_id,)).fetchone()
+        return row[0] if row else None
+    
+    def count_profiles(self) -> int:
+        """Return the number of stored global profiles."""
+        return self._db.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
     
-    def _clear_cache_if_needed(self):
-        """Clear cache if it's been too long since last clear."""
-        now = datetime.now(timezone.utc)
-        if (now - self._last_cache_clear).total_seconds() > self._cache_timeout:
-            self._profile_cache.clear()
-            self._last_cache_clear = now
+    def import_json_profiles(self) -> int:
+        """
+        Import legacy ``global_profiles/*.json`` files into the database.
+        
+        Existing rows are replaced. The JSON files are left in place. Files that do not
+        hold a JSON object with a numeric user ID are skipped. A successful import is
+        recorded so it does not run again on the next start.
+        
+        Returns:
+            Number of profiles imported
+        """
+        imported = 0
+        try:
+            self._db.execute("BEGIN")
+            with os.scandir(self.global_profiles_dir) as it:
+                profile_files = [entry.path for entry in it if entry.name.endswith(".json") and entry.is_file()]
+            
+            for profile_file in profile_files:
+                try:
+                    with open(profile_file, 'rb') as f:
+                        profile = self._decode_profile(f.read())
+                    if not isinstance(profile, dict):
+                        raise ValueError(f"expected a JSON object, got {type(profile).__name__}")
+                    user_id = int(profile.get("user_id", Path(profile_file).stem))
+                    blob = self._encode_profile(profile)
+                except (json.JSONDecodeError, IOError, ValueError, TypeError) as e:
+                    logger.warning(f"Skipping unreadable profile {profile_file}: {e}")
+                    continue
+                
+                self._db.execute(
+                    "INSERT OR REPLACE INTO profiles (user_id, blob) VALUES (?, ?)",
+                    (user_id, blob)
+                )
+                imported += 1
+            self._db.execute(f"PRAGMA user_version = {_LEGACY_IMPORT_DONE}")
+            self._db.execute("COMMIT")
+        except (sqlite3.Error, OSError) as e:
+            self._rollback()
+            logger.error(f"Error importing global profiles: {e}")
+            return 0
+        except BaseException:
+            # Never leave the autocommit connection inside an open transaction
+            self._rollback()
+            raise
+        
+        if imported:
+            logger.info(f"Imported {imported} global profiles from {self.global_profiles_dir}")
+        return imported
+    
+    def _rollback(self):
+        """Roll back the open transaction, if any."""
+        if self._db.in_transaction:
+            self._db.execute("ROLLBACK")
+    
+    @staticmethod
+    def _encode_profile(profile: Dict[str, Any]) -> bytes:
+        """Serialize a profile for storage."""
+        if orjson is not None:
+            return orjson.dumps(profile, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(profile).encode('utf-8')
+    
+    @staticmethod
+    def _decode_profile(blob: bytes) -> Dict[str, Any]:
+        """Deserialize a stored profile."""
+        if orjson is not None:
+            return orjson.loads(blob)
+        return json.loads(blob)
+    
+    def _iter_profiles(self):
+        """Yield every stored profile, skipping rows that fail to decode."""
+        for user_id, blob in self._db.execute("SELECT user_id, blob FROM profiles"):
+            try:
+                yield self._decode_profile(blob)
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning(f"Error reading profile {user_id}: {e}")
     
     def load_global_profile(self, user_id: int) -> Dict[str, Any]:
         """
@@ -51,27 +253,42 @@ class GlobalProfileManager:
         Returns:
             Global profile data dictionary
         """
-        self._clear_cache_if_needed()
+        return self._get_cached_profile(user_id).copy()
+    
+    def load_global_profile_readonly(self, user_id: int) -> Mapping[str, Any]:
+        """
+        Load or create a global user profile without copying it.
         
+        Args:
+            user_id: Discord user ID
+            
+        Returns:
+            Read-only view of the cached profile; use load_global_profile to modify
+        """
+        return MappingProxyType(self._get_cached_profile(user_id))
+    
+    def _get_cached_profile(self, user_id: int) -> Dict[str, Any]:
+        """Return the cached profile dict, loading or creating it if needed."""
         # Check cache first
-        if user_id in self._profile_cache:
-            return self._profile_cache[user_id].copy()
-        
-        profile_file = self.global_profiles_dir / f"{user_id}.json"
+        cached = self._profile_cache.get(user_id)
+        if cached is not None:
+            return cached
         
-        if profile_file.exists():
-            try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile = json.load(f)
-                    self._profile_cache[user_id] = profile
-                    return profile.copy()
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Error loading global profile for user {user_id}: {e}")
+        try:
+            row = self._db.execute(
+                "SELECT blob FROM profiles WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if row is not None:
+                profile = self._decode_profile(row[0])
+                self._profile_cache.set(user_id, profile)
+                return profile
+        except (json.JSONDecodeError, UnicodeDecodeError, sqlite3.Error) as e:
+            logger.error(f"Error loading global profile for user {user_id}: {e}")
         
         # Create new profile
         profile = self._create_default_profile(user_id)
         self.save_global_profile(user_id, profile)
-        return profile.copy()
+        return profile
     
     def _create_default_profile(self, user_id: int) -> Dict[str, Any]:
         """Create a default global profile for a new user."""
@@ -97,33 +314,8 @@ class GlobalProfileManager:
                 "owned_heroes": {}
             },
             "skills": skill_manager.get_default_skills(),
-            "resources": {
-                "basic_hero_shards": 0,
-                "epic_hero_shards": 0,
-                "skill_points": 0
-            },
-            "duel_stats": {
-                "total_duels": 0,
-                "duel_wins": 0,
-                "duel_losses": 0,
-                "duel_draws": 0,
-                "win_rate": 0.0,
-                "current_streak": 0,
-                "best_streak": 0,
-                "duel_rating": 1000,
-                "total_damage_dealt": 0,
-                "total_damage_taken": 0,
-                "favorite_element": None,
-                "element_stats": {
-                    "fire": {"wins": 0, "losses": 0, "draws": 0},
-                    "water": {"wins": 0, "losses": 0, "draws": 0},
-                    "earth": {"wins": 0, "losses": 0, "draws": 0},
-                    "air": {"wins": 0, "losses": 0, "draws": 0}
-                },
-                "recent_duels": [],
-                "achievements": [],
-                "last_duel_at": None
-            },
+            "resources": dict(_DEFAULT_RESOURCES),
+            "duel_stats": copy.deepcopy(_DEFAULT_DUEL_STATS),
             "achievements": {
                 "global": [],
                 "server_specific": {}
@@ -149,16 +341,26 @@ class GlobalProfileManager:
             profile: Profile data to save
         """
         try:
-            profile["last_updated"] = datetime.now(timezone.utc).isoformat()
-            profile_file = self.global_profiles_dir / f"{user_id}.json"
+            # Skip the write when nothing but the timestamp would change
+            digest = hashlib.blake2b(
+                self._encode_profile({**profile, "last_updated": None}), digest_size=16
+            ).digest()
+            if self._profile_digests.get(user_id) == digest:
+                self._profile_cache.set(user_id, profile.copy())
+                return
             
-            with open(profile_file, 'w', encoding='utf-8') as f:
-                json.dump(profile, f, indent=2)
+            profile["last_updated"] = datetime.now(timezone.utc).isoformat()
+            self._db.execute(
+                "INSERT OR REPLACE INTO profiles (user_id, blob) VALUES (?, ?)",
+                (user_id, self._encode_profile(profile))
+            )
+            self._profile_digests[user_id] = digest
             
             # Update cache
-            self._profile_cache[user_id] = profile.copy()
+            self._profile_cache.set(user_id, profile.copy())
+            self._update_leaderboard_entries(profile)
             
-        except IOError as e:
+        except sqlite3.Error as e:
             logger.error(f"Error saving global profile for user {user_id}: {e}")
     
     def update_global_stats(self, user_id: int, guild_id: int, game_stats: Dict[str, Any]):
@@ -199,13 +401,7 @@ class GlobalProfileManager:
     
     def _calculate_global_level(self, total_xp: int) -> int:
         """Calculate global level based on total XP using exponential curve."""
-        if total_xp <= 0:
-            return 1
-        
-        # XP curve: level = floor(sqrt(total_xp / 100)) + 1
-        # This means: Level 1: 0-99 XP, Level 2: 100-399 XP, Level 3: 400-899 XP, etc.
-        import math
-        return int(math.sqrt(total_xp / 100)) + 1
+        return _global_level(total_xp)
     
     def _check_global_achievements(self, profile: Dict[str, Any]):
         """Check and award global achievements."""
@@ -259,77 +455,83 @@ class GlobalProfileManager:
         Returns:
             List of leaderboard entries
         """
-        # Check for cached leaderboard
-        cache_file = self.leaderboard_cache_dir / "global_cache.json"
-        cache_age_limit = 600  # 10 minutes
-        
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                
-                # Check if cache is still valid
-                last_updated = datetime.fromisoformat(cache_data["last_updated"].replace('Z', '+00:00'))
-                if (datetime.now(timezone.utc) - last_updated).total_seconds() < cache_age_limit:
-                    rankings = cache_data.get("rankings", [])
-                    return self._sort_leaderboard(rankings, category)[:limit]
-            except (json.JSONDecodeError, IOError, KeyError) as e:
-                logger.warning(f"Error reading global leaderboard cache: {e}")
-        
-        # Build fresh leaderboard
-        return self._build_global_leaderboard(limit, category)
+        return self._sort_leaderboard(self._get_global_entries().values(), category, limit)
     
     def _build_global_leaderboard(self, limit: int, category: str) -> List[Dict[str, Any]]:
-        """Build global leaderboard from all user profiles."""
-        entries = []
-        
-        for profile_file in self.global_profiles_dir.glob("*.json"):
-            try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile = json.load(f)
-                
-                # Skip if user opts out of global leaderboard
-                if not profile.get("preferences", {}).get("privacy_settings", {}).get("show_on_global_leaderboard", True):
-                    continue
-                
-                global_stats = profile.get("global_stats", {})
-                
-                # Only include users who have played games
-                if global_stats.get("total_games_played", 0) == 0:
-                    continue
-                
-                # Calculate accuracy
-                total_questions = global_stats.get("total_questions_answered", 0)
-                correct_answers = global_stats.get("total_correct_answers", 0)
-                accuracy = (correct_answers / total_questions * 100) if total_questions > 0 else 0
-                
-                entry = {
-                    "user_id": profile["user_id"],
-                    "global_level": global_stats.get("global_level", 1),
-                    "total_xp": global_stats.get("total_xp", 0),
-                    "total_correct": correct_answers,
-                    "total_games": global_stats.get("total_games_played", 0),
-                    "accuracy": round(accuracy, 1),
-                    "best_streak": global_stats.get("best_streak_ever", 0),
-                    "perfect_games": global_stats.get("perfect_games_total", 0),
-                    "servers_count": len(global_stats.get("servers_played", [])),
-                    "display_name": profile.get("preferences", {}).get("display_name"),
-                    "custom_title": profile.get("preferences", {}).get("custom_title")
-                }
-                entries.append(entry)
-                
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Error reading profile {profile_file}: {e}")
+        """Rebuild the in-memory global leaderboard from all stored profiles."""
+        self._global_entries = None
+        entries = self._get_global_entries()
+        
+        # Cache all entries; readers re-rank them per category
+        self._cache_global_leaderboard(list(entries.values()))
+        
+        return self._sort_leaderboard(entries.values(), category, limit)
+    
+    def _get_global_entries(self) -> Dict[int, Dict[str, Any]]:
+        """Return leaderboard entries keyed by user ID, building them on first use."""
+        if self._global_entries is None:
+            self._global_entries = {}
+            for profile in self._iter_profiles():
+                entry = self._global_leaderboard_entry(profile)
+                if entry is not None:
+                    self._global_entries[entry["user_id"]] = entry
+        return self._global_entries
+    
+    def _update_leaderboard_entries(self, profile: Dict[str, Any]):
+        """Keep the in-memory leaderboards in step with a saved profile."""
+        user_id = profile["user_id"]
+        for entries, project in (
+            (self._global_entries, self._global_leaderboard_entry),
+            (self._duel_entries, self._duel_leaderboard_entry),
+        ):
+            if entries is None:
                 continue
+            
+            entry = project(profile)
+            if entry is None:
+                entries.pop(user_id, None)
+            else:
+                entries[user_id] = entry
+        
+        self._duel_leaderboard_cache.clear()
+    
+    @staticmethod
+    def _global_leaderboard_entry(profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Project a profile onto a global leaderboard entry, or None if it is not ranked."""
+        preferences = profile.get("preferences", _EMPTY)
+        
+        # Skip if user opts out of global leaderboard
+        if not preferences.get("privacy_settings", _EMPTY).get("show_on_global_leaderboard", True):
+            return None
+        
+        global_stats = profile.get("global_stats", _EMPTY)
+        
+        # Only include users who have played games
+        if global_stats.get("total_games_played", 0) == 0:
+            return None
         
-        # Sort and cache
-        sorted_entries = self._sort_leaderboard(entries, category)
-        self._cache_global_leaderboard(sorted_entries)
+        # Calculate accuracy
+        total_questions = global_stats.get("total_questions_answered", 0)
+        correct_answers = global_stats.get("total_correct_answers", 0)
+        accuracy = (correct_answers / total_questions * 100) if total_questions > 0 else 0
         
-        return sorted_entries[:limit]
+        return {
+            "user_id": profile["user_id"],
+            "global_level": global_stats.get("global_level", 1),
+            "total_xp": global_stats.get("total_xp", 0),
+            "total_correct": correct_answers,
+            "total_games": global_stats.get("total_games_played", 0),
+            "accuracy": round(accuracy, 1),
+            "best_streak": global_stats.get("best_streak_ever", 0),
+            "perfect_games": global_stats.get("perfect_games_total", 0),
+            "servers_count": len(global_stats.get("servers_played", [])),
+            "display_name": preferences.get("display_name"),
+            "custom_title": preferences.get("custom_title")
+        }
     
-    def _sort_leaderboard(self, entries: List[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
-        """Sort leaderboard entries by the specified category."""
+    def _sort_leaderboard(self, entries: Collection[Dict[str, Any]], category: str,
+                          limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Sort leaderboard entries by the specified category, keeping the top ``limit``."""
         sort_key_map = {
             "total_xp": "total_xp",
             "accuracy": "accuracy",
@@ -340,7 +542,15 @@ class GlobalProfileManager:
         }
         
         sort_key = sort_key_map.get(category, "total_xp")
-        return sorted(entries, key=lambda x: x.get(sort_key, 0), reverse=True)
+        
+        def key(entry: Dict[str, Any]) -> Any:
+            # Entries missing the field rank as zero
+            return entry.get(sort_key, 0)
+        
+        # Top-k selection is O(N log k) when only a few entries are wanted
+        if limit is not None and limit < len(entries):
+            return heapq.nlargest(limit, entries, key=key)
+        return sorted(entries, key=key, reverse=True)
     
     def _cache_global_leaderboard(self, entries: List[Dict[str, Any]]):
         """Cache the global leaderboard for faster access."""
@@ -350,9 +560,15 @@ class GlobalProfileManager:
                 "rankings": entries
             }
             
+            # Write to a temporary file first so readers never see a partial cache
             cache_file = self.leaderboard_cache_dir / "global_cache.json"
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            temp_file = cache_file.with_suffix(".json.tmp")
+            with open(temp_file, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(cache_data, indent=2).encode('utf-8'))
+            os.replace(temp_file, cache_file)
                 
         except IOError as e:
             logger.error(f"Error caching global leaderboard: {e}")
@@ -419,7 +635,7 @@ class GlobalProfileManager:
     
     def get_hero(self, user_id: int, element: str) -> Optional[Dict[str, Any]]:
         """Get hero data for a specific element."""
-        profile = self.load_global_profile(user_id)
+        profile = self.load_global_profile_readonly(user_id)
         return profile["heroes"]["owned_heroes"].get(element)
     
     def update_hero(self, user_id: int, element: str, hero_data: Dict[str, Any]):
@@ -443,7 +659,7 @@ class GlobalProfileManager:
     
     def get_primary_hero(self, user_id: int) -> Optional[Tuple[str, Dict[str, Any]]]:
         """Get the primary hero data."""
-        profile = self.load_global_profile(user_id)
+        profile = self.load_global_profile_readonly(user_id)
         primary_element = profile["heroes"]["primary_element"]
         
         if primary_element and primary_element in profile["heroes"]["owned_heroes"]:
@@ -454,12 +670,11 @@ class GlobalProfileManager:
     # Resource management methods
     def get_resources(self, user_id: int) -> Dict[str, int]:
         """Get user's current resources."""
-        profile = self.load_global_profile(user_id)
-        return profile.get("resources", {
-            "basic_hero_shards": 0,
-            "epic_hero_shards": 0,
-            "skill_points": 0
-        })
+        profile = self.load_global_profile_readonly(user_id)
+        resources = profile.get("resources")
+        if resources is None:
+            return dict(_DEFAULT_RESOURCES)
+        return resources
     
     def update_resources(self, user_id: int, resources: Dict[str, int]):
         """Update user's resources."""
@@ -478,7 +693,7 @@ class GlobalProfileManager:
     # Skill management methods
     def get_skills(self, user_id: int) -> Dict[str, Dict[str, bool]]:
         """Get user's current skill tree progress."""
-        profile = self.load_global_profile(user_id)
+        profile = self.load_global_profile_readonly(user_id)
         return profile.get("skills", skill_manager.get_default_skills())
     
     def update_skills(self, user_id: int, skills: Dict[str, Dict[str, bool]]):
@@ -542,11 +757,7 @@ class GlobalProfileManager:
                     self.add_resources(user_id, resource_type, amount)
                     
             # Clear minigame inventory after sync
-            minigame_player["inventory"] = {
-                "basic_hero_shards": 0,
-                "epic_hero_shards": 0,
-                "skill_points": 0
-            }
+            minigame_player["inventory"] = dict(_DEFAULT_RESOURCES)
             
             # Save updated minigame profile
             from cogs.minigame_daily import save_player
@@ -560,29 +771,11 @@ class GlobalProfileManager:
     # Duel statistics methods
     def get_duel_stats(self, user_id: int) -> Dict[str, Any]:
         """Get user's duel statistics."""
-        profile = self.load_global_profile(user_id)
-        return profile.get("duel_stats", {
-            "total_duels": 0,
-            "duel_wins": 0,
-            "duel_losses": 0,
-            "duel_draws": 0,
-            "win_rate": 0.0,
-            "current_streak": 0,
-            "best_streak": 0,
-            "duel_rating": 1000,
-            "total_damage_dealt": 0,
-            "total_damage_taken": 0,
-            "favorite_element": None,
-            "element_stats": {
-                "fire": {"wins": 0, "losses": 0, "draws": 0},
-                "water": {"wins": 0, "losses": 0, "draws": 0},
-                "earth": {"wins": 0, "losses": 0, "draws": 0},
-                "air": {"wins": 0, "losses": 0, "draws": 0}
-            },
-            "recent_duels": [],
-            "achievements": [],
-            "last_duel_at": None
-        })
+        profile = self.load_global_profile_readonly(user_id)
+        duel_stats = profile.get("duel_stats")
+        if duel_stats is None:
+            return copy.deepcopy(_DEFAULT_DUEL_STATS)
+        return duel_stats
     
     def update_duel_stats(self, user_id: int, duel_stats: Dict[str, Any]):
         """Update user's duel statistics."""
@@ -594,17 +787,16 @@ class GlobalProfileManager:
         """Record the result of a duel for both participants."""
         from .duel_manager import BattleResult
         
-        # Get current stats for both players
+        # Get current stats for both players (loaded once, updated in place)
         winner_stats = self.get_duel_stats(winner_id)
-        loser_stats = self.get_duel_stats(loser_id) if not is_draw else self.get_duel_stats(loser_id)
+        loser_stats = self.get_duel_stats(loser_id)
         
         # Update total duels for both
         winner_stats["total_duels"] += 1
         winner_stats["last_duel_at"] = datetime.now(timezone.utc).isoformat()
         
-        if not is_draw:
-            loser_stats["total_duels"] += 1
-            loser_stats["last_duel_at"] = datetime.now(timezone.utc).isoformat()
+        loser_stats["total_duels"] += 1
+        loser_stats["last_duel_at"] = datetime.now(timezone.utc).isoformat()
         
         # Calculate rating changes
         winner_rating_change, loser_rating_change = rating_system.calculate_rating_change(
@@ -622,12 +814,9 @@ class GlobalProfileManager:
             winner_stats["duel_rating"] += winner_rating_change
             
             # For draws, both players get same treatment
-            loser_stats = self.get_duel_stats(loser_id)
-            loser_stats["total_duels"] += 1
             loser_stats["duel_draws"] += 1
             loser_stats["current_streak"] = 0
             loser_stats["duel_rating"] += loser_rating_change
-            loser_stats["last_duel_at"] = datetime.now(timezone.utc).isoformat()
         else:
             # Handle win/loss
             winner_stats["duel_wins"] += 1
@@ -662,9 +851,8 @@ class GlobalProfileManager:
             loser_stats["element_stats"][loser_element]["draws"] += 1
         
         # Update favorite element (most used)
-        winner_stats["favorite_element"] = self._calculate_favorite_element(winner_stats["element_stats"])
-        if not is_draw:
-            loser_stats["favorite_element"] = self._calculate_favorite_element(loser_stats["element_stats"])
+        self._update_favorite_element(winner_stats, winner_element)
+        self._update_favorite_element(loser_stats, loser_element)
         
         # Add to recent duels (keep last 10)
         duel_summary = {
@@ -697,10 +885,7 @@ class GlobalProfileManager:
         
         # Save updated stats
         self.update_duel_stats(winner_id, winner_stats)
-        if not is_draw:
-            self.update_duel_stats(loser_id, loser_stats)
-        else:
-            self.update_duel_stats(loser_id, loser_stats)
+        self.update_duel_stats(loser_id, loser_stats)
         
         return {
             "winner_rating_change": winner_rating_change,
@@ -709,106 +894,112 @@ class GlobalProfileManager:
             "loser_new_rating": loser_stats["duel_rating"]
         }
     
-    def _calculate_favorite_element(self, element_stats: Dict[str, Dict[str, int]]) -> Optional[str]:
-        """Calculate the most used element."""
-        element_totals = {}
-        for element, stats in element_stats.items():
-            total = stats["wins"] + stats["losses"] + stats["draws"]
-            if total > 0:
-                element_totals[element] = total
-        
-        if not element_totals:
-            return None
+    def _update_favorite_element(self, duel_stats: Dict[str, Any], element: Optional[str]):
+        """Count a duel fought with ``element`` and refresh the most used element."""
+        totals = duel_stats.get("element_totals")
+        if totals is None:
+            # Backfill older profiles from per-element results, which include this duel
+            totals = {
+                name: stats["wins"] + stats["losses"] + stats["draws"]
+                for name, stats in duel_stats["element_stats"].items()
+            }
+            duel_stats["element_totals"] = totals
+        elif element:
+            totals[element] = totals.get(element, 0) + 1
         
-        return max(element_totals, key=element_totals.get)
+        duel_stats["favorite_element"] = max(totals, key=totals.get) if any(totals.values()) else None
     
     def _check_duel_achievements(self, duel_stats: Dict[str, Any]):
         """Check and award duel achievements."""
         current_achievements = set(duel_stats.get("achievements", []))
         new_achievements = []
         
-        # Achievement definitions
-        achievement_checks = [
-            ("first_blood", lambda stats: stats["duel_wins"] >= 1),
-            ("dueling_novice", lambda stats: stats["total_duels"] >= 10),
-            ("dueling_veteran", lambda stats: stats["total_duels"] >= 50),
-            ("dueling_master", lambda stats: stats["total_duels"] >= 100),
-            ("unstoppable", lambda stats: stats["best_streak"] >= 5),
-            ("dominator", lambda stats: stats["best_streak"] >= 10),
-            ("legend", lambda stats: stats["best_streak"] >= 15),
-            ("element_master_fire", lambda stats: stats["element_stats"]["fire"]["wins"] >= 10),
-            ("element_master_water", lambda stats: stats["element_stats"]["water"]["wins"] >= 10),
-            ("element_master_earth", lambda stats: stats["element_stats"]["earth"]["wins"] >= 10),
-            ("element_master_air", lambda stats: stats["element_stats"]["air"]["wins"] >= 10),
-            ("silver_rank", lambda stats: stats["duel_rating"] >= 1200),
-            ("gold_rank", lambda stats: stats["duel_rating"] >= 1400),
-            ("platinum_rank", lambda stats: stats["duel_rating"] >= 1600),
-            ("diamond_rank", lambda stats: stats["duel_rating"] >= 1800),
-            ("master_rank", lambda stats: stats["duel_rating"] >= 2000),
-        ]
-        
-        for achievement_id, check_func in achievement_checks:
-            if achievement_id not in current_achievements and check_func(duel_stats):
+        for achievement_id, path, threshold in _DUEL_ACHIEVEMENTS:
+            if achievement_id in current_achievements:
+                continue
+            if reduce(dict.__getitem__, path, duel_stats) >= threshold:
                 new_achievements.append(achievement_id)
                 current_achievements.add(achievement_id)
         
-        duel_stats["achievements"] = list(current_achievements)
+        if new_achievements or "achievements" not in duel_stats:
+            duel_stats["achievements"] = list(current_achievements)
         return new_achievements
     
     def get_duel_leaderboard(self, limit: int = 50, category: str = "rating") -> List[Dict[str, Any]]:
         """Get duel leaderboard rankings."""
-        entries = []
-        
-        for profile_file in self.global_profiles_dir.glob("*.json"):
-            try:
-                with open(profile_file, 'r', encoding='utf-8') as f:
-                    profile = json.load(f)
-                
-                duel_stats = profile.get("duel_stats", {})
-                
-                # Only include users who have dueled
-                if duel_stats.get("total_duels", 0) == 0:
-                    continue
-                
-                entry = {
-                    "user_id": profile["user_id"],
-                    "duel_rating": duel_stats.get("duel_rating", 1000),
-                    "total_duels": duel_stats.get("total_duels", 0),
-                    "duel_wins": duel_stats.get("duel_wins", 0),
-                    "duel_losses": duel_stats.get("duel_losses", 0),
-                    "win_rate": duel_stats.get("win_rate", 0.0),
-                    "best_streak": duel_stats.get("best_streak", 0),
-                    "favorite_element": duel_stats.get("favorite_element"),
-                    "display_name": profile.get("preferences", {}).get("display_name"),
-                    "tier": rating_system.get_tier_from_rating(duel_stats.get("duel_rating", 1000))
-                }
-                entries.append(entry)
-                
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Error reading profile {profile_file}: {e}")
-                continue
-        
-        # Sort by category
-        if category == "rating":
-            entries.sort(key=lambda x: x["duel_rating"], reverse=True)
-        elif category == "wins":
-            entries.sort(key=lambda x: x["duel_wins"], reverse=True)
-        elif category == "win_rate":
-            entries.sort(key=lambda x: (x["win_rate"], x["total_duels"]), reverse=True)
-        elif category == "streak":
-            entries.sort(key=lambda x: x["best_streak"], reverse=True)
+        # Serve bursts of identical queries from the short-lived cache
+        now = time.monotonic()
+        cached = self._duel_leaderboard_cache.get((limit, category))
+        if cached is not None and now - cached[0] < self._duel_leaderboard_ttl:
+            return list(cached[1])
+        
+        entries = self._get_duel_entries().values()
+        
+        # Top-k by category; unknown categories keep index order
+        sort_key = _DUEL_SORT_KEYS.get(category)
+        if sort_key is None:
+            result = list(islice(entries, limit))
+        else:
+            result = heapq.nlargest(limit, entries, key=sort_key)
+        
+        self._duel_leaderboard_cache[(limit, category)] = (now, result)
+        return list(result)
+    
+    def _get_duel_entries(self) -> Dict[int, Dict[str, Any]]:
+        """Return duel leaderboard entries keyed by user ID, building them on first use."""
+        if self._duel_entries is None:
+            self._duel_entries = {}
+            for profile in self._iter_profiles():
+                entry = self._duel_leaderboard_entry(profile)
+                if entry is not None:
+                    self._duel_entries[entry["user_id"]] = entry
+        return self._duel_entries
+    
+    @staticmethod
+    def _duel_leaderboard_entry(profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Project a profile onto a duel leaderboard entry, or None if it has no duels."""
+        duel_stats = profile.get("duel_stats", _EMPTY)
+        
+        # Only include users who have dueled
+        if duel_stats.get("total_duels", 0) == 0:
+            return None
         
-        return entries[:limit]
+        return {
+            "user_id": profile["user_id"],
+            "duel_rating": duel_stats.get("duel_rating", 1000),
+            "total_duels": duel_stats.get("total_duels", 0),
+            "duel_wins": duel_stats.get("duel_wins", 0),
+            "duel_losses": duel_stats.get("duel_losses", 0),
+            "win_rate": duel_stats.get("win_rate", 0.0),
+            "best_streak": duel_stats.get("best_streak", 0),
+            "favorite_element": duel_stats.get("favorite_element"),
+            "display_name": profile.get("preferences", _EMPTY).get("display_name"),
+            "tier": rating_system.get_tier_from_rating(duel_stats.get("duel_rating", 1000))
+        }
     
     def get_user_duel_rank(self, user_id: int, category: str = "rating") -> Optional[int]:
         """Get user's rank in the duel leaderboard."""
-        leaderboard = self.get_duel_leaderboard(limit=1000, category=category)
-        
-        for rank, entry in enumerate(leaderboard, 1):
-            if entry["user_id"] == user_id:
-                return rank
+        entries = self._get_duel_entries()
+        user_entry = entries.get(user_id)
+        if user_entry is None:
+            return None
         
-        return None
+        sort_key = _DUEL_SORT_KEYS.get(category)
+        if sort_key is None:
+            return next(rank for rank, other_id in enumerate(entries, 1) if other_id == user_id)
+        
+        # Count entries ranked ahead without sorting; ties keep index order
+        user_value = sort_key(user_entry)
+        rank = 1
+        ahead_on_tie = True
+        for other_id, entry in entries.items():
+            if other_id == user_id:
+                ahead_on_tie = False
+                continue
+            value = sort_key(entry)
+            if value > user_value or (ahead_on_tie and value == user_value):
+                rank += 1
+        return rank
 
 # Global instance
 global_profile_manager = GlobalProfileManager()
@@ -4,11 +4,17 @@ Handles permanent invite creation and storage to prevent duplicate invites.
 """
 
 import discord
+import asyncio
 import json
 import logging
 from pathlib import Path
 from typing import Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 class InviteManager:
@@ -19,11 +25,18 @@ class InviteManager:
         self.invites_file = self.data_dir / "permanent_invites.json"
         self.invites_data = self._load_invites()
         
+        # Changes are written out in batches by flush_periodically()
+        self.flush_interval = 60  # seconds
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        
     def _load_invites(self) -> Dict[str, str]:
         """Load existing permanent invites from file."""
         try:
             if self.invites_file.exists():
-                with open(self.invites_file, 'r') as f:
+                with open(self.invites_file, 'rb') as f:
+                    if orjson is not None:
+                        return orjson.loads(f.read())
                     return json.load(f)
             else:
                 # Create directory if it doesn't exist
@@ -36,11 +49,35 @@ class InviteManager:
     def _save_invites(self):
         """Save permanent invites to file."""
         try:
-            with open(self.invites_file, 'w') as f:
-                json.dump(self.invites_data, f, indent=2)
+            with open(self.invites_file, 'wb') as f:
+                if orjson is not None:
+                    f.write(orjson.dumps(self.invites_data, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(self.invites_data, indent=2).encode('utf-8'))
         except Exception as e:
             logger.error(f"Error saving invites: {e}")
     
+    def flush(self):
+        """Write pending invite changes to disk."""
+        if self._dirty:
+            self._dirty = False
+            self._save_invites()
+    
+    async def flush_periodically(self):
+        """Flush pending invite changes at most once per flush interval."""
+        while True:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                self.flush()
+            except asyncio.CancelledError:
+                self.flush()
+                break
+    
+    def start_flush_task(self):
+        """Start the background flush task if it is not already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush_periodically())
+    
     def get_invite(self, guild_id: str) -> Optional[str]:
         """Get existing permanent invite for a guild."""
         return self.invites_data.get(str(guild_id))
@@ -48,7 +85,7 @@ class InviteManager:
     def set_invite(self, guild_id: str, invite_url: str):
         """Store a permanent invite for a guild."""
         self.invites_data[str(guild_id)] = invite_url
-        self._save_invites()
+        self._dirty = True
     
     async def get_or_create_permanent_invite(self, guild: discord.Guild) -> str:
         """
@@ -68,14 +105,14 @@ class InviteManager:
             # Verify the invite still exists
             try:
                 # Try to fetch the invite to verify it's still valid
-                invite_code = existing_invite.split('/')[-1]
+                invite_code = existing_invite.rpartition('/')[2]
                 await guild.fetch_invite(invite_code)
                 return existing_invite
             except discord.NotFound:
                 # Invite was deleted, remove from storage
                 logger.info(f"Stored invite for guild {guild.name} ({guild_id}) was deleted, will create new one")
                 del self.invites_data[guild_id]
-                self._save_invites()
+                self._dirty = True
             except Exception as e:
                 logger.warning(f"Error verifying invite for guild {guild.name}: {e}")
                 # Continue to create new invite
@@ -104,25 +141,3 @@ class InviteManager:
         except Exception as e:
             logger.error(f"Error creating invite for guild {guild.name}: {e}")
             return "Error creating invite"
-    
-    async def cleanup_invalid_invites(self):
-        """Clean up invalid invites from storage."""
-        invalid_guilds = []
-        
-        for guild_id, invite_url in self.invites_data.items():
-            try:
-                # Try to fetch the invite to verify it's still valid
-                invite_code = invite_url.split('/')[-1]
-                # We can't fetch invites without guild context, so we'll just keep them
-                # and let the get_or_create_permanent_invite method handle verification
-                continue
-            except Exception:
-                invalid_guilds.append(guild_id)
-        
-        # Remove invalid invites
-        for guild_id in invalid_guilds:
-            del self.invites_data[guild_id]
-            logger.info(f"Removed invalid invite for guild {guild_id}")
-        
-        if invalid_guilds:
-            self._save_invites()
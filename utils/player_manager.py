@@ -7,19 +7,32 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class UpgradeCost:
+# Element display emojis
+ELEMENT_EMOJIS = {
+    "fire": "🔥",
+    "water": "💧", 
+    "earth": "🌍",
+    "air": "💨"
+}
+
+# Embed color codes by rarity
+RARITY_COLORS = {
+    "rare": 0x3498db,     # Blue
+    "epic": 0x9b59b6,     # Purple
+    "legendary": 0xf39c12  # Orange/Gold
+}
+
+class UpgradeCost(NamedTuple):
     """Represents the cost to upgrade a player."""
     basic_hero_shards: int
     epic_hero_shards: int
 
-@dataclass
-class PlayerStats:
+class PlayerStats(NamedTuple):
     """Represents a player's stats."""
     base_atk: int
     base_def: int
@@ -28,9 +41,36 @@ class PlayerStats:
     current_def: int
     current_hp: int
 
+@lru_cache(maxsize=4096)
+def _calculate_stats(star_level: int, base_atk: int, base_def: int, base_hp: int,
+                     atk_bonus: float, def_bonus: float, hp_bonus: float,
+                     all_stats_bonus: float) -> Tuple[int, int, int, int, int, int]:
+    """Memoized stat arithmetic, returned in PlayerStats field order."""
+    # Base stat multiplier from star progression (15% per star level)
+    star_multiplier = 1 + (star_level - 1) * 0.15
+    
+    # Apply star multiplier to base stats
+    current_atk = int(base_atk * star_multiplier)
+    current_def = int(base_def * star_multiplier)
+    current_hp = int(base_hp * star_multiplier)
+    
+    # Apply skill bonuses
+    current_atk = int(current_atk * (1 + atk_bonus + all_stats_bonus))
+    current_def = int(current_def * (1 + def_bonus + all_stats_bonus))
+    current_hp = int(current_hp * (1 + hp_bonus + all_stats_bonus))
+    
+    return base_atk, base_def, base_hp, current_atk, current_def, current_hp
+
 class PlayerManager:
     """Manages player progression and upgrades."""
     
+    # Star levels below the first star of each rarity
+    _RARITY_STAR_OFFSET = {"rare": 0, "epic": 2, "legendary": 5}
+    
+    # Rarity ordinals and stride for the flat upgrade cost table
+    _RARITY_ORDINALS = {"rare": 0, "epic": 1, "legendary": 2}
+    _STARS_PER_RARITY = 10
+    
     def __init__(self):
         self.data_dir = Path("data/game/players")
         self.data_dir.mkdir(parents=True, exist_ok=True)
@@ -55,6 +95,12 @@ class PlayerManager:
             ("legendary", 5): UpgradeCost(0, 40), # Legendary 5★ → 6★
         }
         
+        # Flat table indexed by rarity ordinal * stride + stars
+        cost_table = [None] * (len(self._RARITY_ORDINALS) * self._STARS_PER_RARITY)
+        for (rarity, stars), cost in self.upgrade_costs.items():
+            cost_table[self._RARITY_ORDINALS[rarity] * self._STARS_PER_RARITY + stars] = cost
+        self._cost_table: Tuple[Optional[UpgradeCost], ...] = tuple(cost_table)
+        
         # Base stats by element
         self.base_stats = {
             "fire": {"base_atk": 100, "base_def": 80, "base_hp": 120},
@@ -94,57 +140,40 @@ class PlayerManager:
         # Calculate star level (total progression)
         star_level = self._get_total_star_level(rarity, stars)
         
-        # Base stat multiplier from star progression (15% per star level)
-        star_multiplier = 1 + (star_level - 1) * 0.15
-        
-        # Apply star multiplier to base stats
         base_atk = base_stats.get("base_atk", 100)
         base_def = base_stats.get("base_def", 80)
         base_hp = base_stats.get("base_hp", 120)
         
-        current_atk = int(base_atk * star_multiplier)
-        current_def = int(base_def * star_multiplier)
-        current_hp = int(base_hp * star_multiplier)
-        
-        # Apply skill bonuses
-        atk_bonus = skill_bonuses.get("atk_bonus", 0)
-        def_bonus = skill_bonuses.get("def_bonus", 0)
-        hp_bonus = skill_bonuses.get("hp_bonus", 0)
-        all_stats_bonus = skill_bonuses.get("all_stats_bonus", 0)
-        
-        current_atk = int(current_atk * (1 + atk_bonus + all_stats_bonus))
-        current_def = int(current_def * (1 + def_bonus + all_stats_bonus))
-        current_hp = int(current_hp * (1 + hp_bonus + all_stats_bonus))
-        
-        return PlayerStats(
-            base_atk=base_atk,
-            base_def=base_def,
-            base_hp=base_hp,
-            current_atk=current_atk,
-            current_def=current_def,
-            current_hp=current_hp
-        )
+        return PlayerStats(*_calculate_stats(
+            star_level,
+            base_atk,
+            base_def,
+            base_hp,
+            skill_bonuses.get("atk_bonus", 0),
+            skill_bonuses.get("def_bonus", 0),
+            skill_bonuses.get("hp_bonus", 0),
+            skill_bonuses.get("all_stats_bonus", 0)
+        ))
     
     def _get_total_star_level(self, rarity: str, stars: int) -> int:
         """Convert rarity + stars to total star level for stat calculations."""
-        if rarity == "rare":
-            return stars  # 1-2
-        elif rarity == "epic":
-            return 2 + stars  # 3-5
-        elif rarity == "legendary":
-            return 5 + stars  # 6-11
-        return 1
+        # rare: 1-2, epic: 3-5, legendary: 6-11
+        offset = self._RARITY_STAR_OFFSET.get(rarity)
+        if offset is None:
+            return 1
+        return offset + stars
     
     def get_upgrade_cost(self, hero_data: Dict[str, Any]) -> Optional[UpgradeCost]:
         """Get the cost to upgrade a hero to the next level."""
         rarity = hero_data.get("rarity", "rare")
         stars = hero_data.get("stars", 1)
         
-        # Check if already at max level
-        if rarity == "legendary" and stars >= 6:
+        # Unknown tiers and max level (Legendary 6★) have no entry
+        ordinal = self._RARITY_ORDINALS.get(rarity)
+        if ordinal is None or not 0 <= stars < self._STARS_PER_RARITY:
             return None
         
-        return self.upgrade_costs.get((rarity, stars))
+        return self._cost_table[ordinal * self._STARS_PER_RARITY + stars]
     
     def get_next_tier_info(self, hero_data: Dict[str, Any]) -> Optional[Tuple[str, int]]:
         """Get the next tier (rarity, stars) after upgrade."""
@@ -233,22 +262,11 @@ class PlayerManager:
     
     def get_element_emoji(self, element: str) -> str:
         """Get emoji for an element."""
-        emoji_map = {
-            "fire": "🔥",
-            "water": "💧", 
-            "earth": "🌍",
-            "air": "💨"
-        }
-        return emoji_map.get(element, "⭐")
+        return ELEMENT_EMOJIS.get(element, "⭐")
     
     def get_rarity_color(self, rarity: str) -> int:
         """Get color code for rarity."""
-        color_map = {
-            "rare": 0x3498db,     # Blue
-            "epic": 0x9b59b6,     # Purple
-            "legendary": 0xf39c12  # Orange/Gold
-        }
-        return color_map.get(rarity, 0x95a5a6)
+        return RARITY_COLORS.get(rarity, 0x95a5a6)
     
     def format_star_display(self, stars: int) -> str:
         """Format stars for display."""
@@ -3,25 +3,26 @@ Rating System for Duel Management.
 Handles ELO-style rating calculations and tier management.
 """
 
+import bisect
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple, Mapping
+from enum import IntEnum
 
 logger = logging.getLogger(__name__)
 
-class RatingTier(Enum):
-    """Rating tier classifications."""
-    BRONZE = "Bronze"
-    SILVER = "Silver"
-    GOLD = "Gold"
-    PLATINUM = "Platinum"
-    DIAMOND = "Diamond"
-    MASTER = "Master"
+class RatingTier(IntEnum):
+    """Rating tier classifications, in ascending order (values index per-tier tables)."""
+    BRONZE = 0
+    SILVER = 1
+    GOLD = 2
+    PLATINUM = 3
+    DIAMOND = 4
+    MASTER = 5
 
-@dataclass
-class RatingChange:
+class RatingChange(NamedTuple):
     """Represents a rating change from a duel."""
     old_rating: int
     new_rating: int
@@ -29,8 +30,7 @@ class RatingChange:
     tier_changed: bool
     new_tier: RatingTier
 
-@dataclass
-class SeasonStats:
+class SeasonStats(NamedTuple):
     """Season statistics for a player."""
     season_id: str
     rating: int
@@ -42,76 +42,162 @@ class SeasonStats:
     tier: RatingTier
     rank_in_tier: int
 
+# Display information per tier, indexed by RatingTier (read-only, shared between callers)
+_TIER_INFO = (
+    MappingProxyType({
+        "name": "Bronze",
+        "color": 0xCD7F32,
+        "icon": "🥉",
+        "description": "Novice Duelist"
+    }),
+    MappingProxyType({
+        "name": "Silver", 
+        "color": 0xC0C0C0,
+        "icon": "🥈",
+        "description": "Skilled Fighter"
+    }),
+    MappingProxyType({
+        "name": "Gold",
+        "color": 0xFFD700,
+        "icon": "🥇",
+        "description": "Elite Warrior"
+    }),
+    MappingProxyType({
+        "name": "Platinum",
+        "color": 0xE5E4E2,
+        "icon": "💎",
+        "description": "Master Duelist"
+    }),
+    MappingProxyType({
+        "name": "Diamond",
+        "color": 0xB9F2FF,
+        "icon": "💠",
+        "description": "Legendary Champion"
+    }),
+    MappingProxyType({
+        "name": "Master",
+        "color": 0xFF6B6B,
+        "icon": "👑",
+        "description": "Grandmaster"
+    })
+)
+
+# Base end-of-season rewards per tier
+_SEASONAL_REWARDS = MappingProxyType({
+    RatingTier.BRONZE: {
+        "basic_hero_shards": 3,
+        "epic_hero_shards": 0,
+        "skill_points": 0,
+        "title": None
+    },
+    RatingTier.SILVER: {
+        "basic_hero_shards": 5,
+        "epic_hero_shards": 3,
+        "skill_points": 2,
+        "title": None
+    },
+    RatingTier.GOLD: {
+        "basic_hero_shards": 8,
+        "epic_hero_shards": 5,
+        "skill_points": 3,
+        "title": "Gold Duelist"
+    },
+    RatingTier.PLATINUM: {
+        "basic_hero_shards": 12,
+        "epic_hero_shards": 8,
+        "skill_points": 5,
+        "title": "Platinum Warrior"
+    },
+    RatingTier.DIAMOND: {
+        "basic_hero_shards": 18,
+        "epic_hero_shards": 12,
+        "skill_points": 8,
+        "title": "Diamond Champion"
+    },
+    RatingTier.MASTER: {
+        "basic_hero_shards": 25,
+        "epic_hero_shards": 18,
+        "skill_points": 12,
+        "title": "Grandmaster"
+    }
+})
+
+# Peak rating bonuses (epic_hero_shards, skill_points) by bracket: <2000, 2000+, 2200+
+_PEAK_BONUS_BOUNDS = (2000, 2200)
+_PEAK_BONUSES = ((0, 0), (3, 2), (5, 3))
+
+# Seasonal rewards indexed by RatingTier, then peak bracket, with the bonuses already applied
+_REWARD_TABLE = tuple(
+    tuple(
+        MappingProxyType({
+            **_SEASONAL_REWARDS[tier],
+            "epic_hero_shards": _SEASONAL_REWARDS[tier]["epic_hero_shards"] + epic_bonus,
+            "skill_points": _SEASONAL_REWARDS[tier]["skill_points"] + skill_bonus
+        })
+        for epic_bonus, skill_bonus in _PEAK_BONUSES
+    )
+    for tier in RatingTier
+)
+
+# Duel achievements: (id, name, description, target, duel stat, cap on the stat)
+_ACHIEVEMENT_DEFS = (
+    ("first_blood", "First Blood", "Win your first duel", 1, "duel_wins", 1),
+    ("dueling_novice", "Dueling Novice", "Play 10 duels", 10, "total_duels", None),
+    ("dueling_veteran", "Dueling Veteran", "Play 50 duels", 50, "total_duels", None),
+    ("unstoppable", "Unstoppable", "Win 5 duels in a row", 5, "best_streak", 5),
+    ("dominator", "Dominator", "Win 10 duels in a row", 10, "best_streak", 10),
+    ("silver_rank", "Silver Rank", "Reach Silver tier (1200 rating)", 1200, "duel_rating", None),
+    ("gold_rank", "Gold Rank", "Reach Gold tier (1400 rating)", 1400, "duel_rating", None),
+    ("diamond_rank", "Diamond Rank", "Reach Diamond tier (1800 rating)", 1800, "duel_rating", None),
+)
+
 class RatingSystem:
     """Manages player ratings and tier progression."""
     
     def __init__(self):
-        # Rating tier thresholds
-        self.tier_thresholds = {
-            RatingTier.BRONZE: (0, 1199),
-            RatingTier.SILVER: (1200, 1399),
-            RatingTier.GOLD: (1400, 1599),
-            RatingTier.PLATINUM: (1600, 1799),
-            RatingTier.DIAMOND: (1800, 1999),
-            RatingTier.MASTER: (2000, 9999)
-        }
+        # Rating tier thresholds (min, max), indexed by RatingTier
+        self._thresholds = (
+            (0, 1199),      # Bronze
+            (1200, 1399),   # Silver
+            (1400, 1599),   # Gold
+            (1600, 1799),   # Platinum
+            (1800, 1999),   # Diamond
+            (2000, 9999)    # Master
+        )
+        
+        # Sorted tier lower bounds for bisect lookups
+        self._tier_bounds = tuple(bounds[0] for bounds in self._thresholds)
+        self._tiers_ordered = tuple(RatingTier)
         
         # ELO calculation constants
         self.k_factor_base = 32
         self.rating_difference_divisor = 400
         self.provisional_games = 10  # Games with higher K-factor
         
+        # K-factor by experience bracket: provisional, regular, veteran (50+ games)
+        self._k_bounds = (self.provisional_games, 50)
+        self._k_table = (
+            int(self.k_factor_base * 1.5),
+            self.k_factor_base,
+            int(self.k_factor_base * 0.75)
+        )
+        
         # Starting rating
         self.starting_rating = 1000
+        
+        # Per-instance memo for tier progress (ratings cluster in a narrow band)
+        self._tier_progress_cache = lru_cache(maxsize=4096)(self._build_tier_progress)
     
     def get_tier_from_rating(self, rating: int) -> RatingTier:
         """Get tier based on rating."""
-        for tier, (min_rating, max_rating) in self.tier_thresholds.items():
-            if min_rating <= rating <= max_rating:
-                return tier
-        return RatingTier.BRONZE
+        index = bisect.bisect_right(self._tier_bounds, max(0, rating)) - 1
+        return self._tiers_ordered[index]
     
-    def get_tier_info(self, tier: RatingTier) -> Dict[str, Any]:
-        """Get information about a tier."""
-        tier_info = {
-            RatingTier.BRONZE: {
-                "name": "Bronze",
-                "color": 0xCD7F32,
-                "icon": "🥉",
-                "description": "Novice Duelist"
-            },
-            RatingTier.SILVER: {
-                "name": "Silver", 
-                "color": 0xC0C0C0,
-                "icon": "🥈",
-                "description": "Skilled Fighter"
-            },
-            RatingTier.GOLD: {
-                "name": "Gold",
-                "color": 0xFFD700,
-                "icon": "🥇",
-                "description": "Elite Warrior"
-            },
-            RatingTier.PLATINUM: {
-                "name": "Platinum",
-                "color": 0xE5E4E2,
-                "icon": "💎",
-                "description": "Master Duelist"
-            },
-            RatingTier.DIAMOND: {
-                "name": "Diamond",
-                "color": 0xB9F2FF,
-                "icon": "💠",
-                "description": "Legendary Champion"
-            },
-            RatingTier.MASTER: {
-                "name": "Master",
-                "color": 0xFF6B6B,
-                "icon": "👑",
-                "description": "Grandmaster"
-            }
-        }
-        return tier_info.get(tier, tier_info[RatingTier.BRONZE])
+    def get_tier_info(self, tier: RatingTier) -> Mapping[str, Any]:
+        """Get information about a tier (read-only, shared between callers)."""
+        if not isinstance(tier, RatingTier):
+            tier = RatingTier.BRONZE
+        return _TIER_INFO[tier]
     
     def calculate_rating_change(self, winner_rating: int, loser_rating: int, 
                               winner_games: int, loser_games: int, is_draw: bool = False) -> Tuple[int, int]:
@@ -141,12 +227,7 @@ class RatingSystem:
     
     def _get_k_factor(self, games_played: int) -> int:
         """Get K-factor based on games played."""
-        if games_played < self.provisional_games:
-            return self.k_factor_base * 1.5  # Higher K-factor for new players
-        elif games_played < 50:
-            return self.k_factor_base
-        else:
-            return self.k_factor_base * 0.75  # Lower K-factor for experienced players
+        return self._k_table[bisect.bisect_right(self._k_bounds, games_played)]
     
     def apply_rating_change(self, current_rating: int, rating_change: int, 
                           games_played: int) -> RatingChange:
@@ -168,16 +249,17 @@ class RatingSystem:
     
     def get_leaderboard_position(self, user_rating: int, all_ratings: List[int]) -> int:
         """Get user's position in the leaderboard."""
-        sorted_ratings = sorted(all_ratings, reverse=True)
-        try:
-            return sorted_ratings.index(user_rating) + 1
-        except ValueError:
-            return len(sorted_ratings) + 1
+        # Position is one more than the number of strictly higher ratings
+        return 1 + sum(1 for rating in all_ratings if rating > user_rating)
     
-    def calculate_tier_progress(self, rating: int) -> Dict[str, Any]:
-        """Calculate progress within current tier."""
+    def calculate_tier_progress(self, rating: int) -> Mapping[str, Any]:
+        """Calculate progress within current tier (read-only, shared between callers)."""
+        return self._tier_progress_cache(rating)
+    
+    def _build_tier_progress(self, rating: int) -> Mapping[str, Any]:
+        """Build the tier progress mapping for a rating."""
         current_tier = self.get_tier_from_rating(rating)
-        min_rating, max_rating = self.tier_thresholds[current_tier]
+        min_rating, max_rating = self._thresholds[current_tier]
         
         # Special case for Master tier (no upper limit)
         if current_tier == RatingTier.MASTER:
@@ -189,67 +271,20 @@ class RatingSystem:
             progress_percentage = (progress / tier_range) * 100
             rating_needed = max_rating + 1 - rating
         
-        return {
+        return MappingProxyType({
             "current_tier": current_tier,
             "rating": rating,
             "tier_min": min_rating,
             "tier_max": max_rating if current_tier != RatingTier.MASTER else None,
             "progress_percentage": progress_percentage,
             "rating_needed_next_tier": max(0, rating_needed)
-        }
+        })
     
     def get_seasonal_rewards(self, tier: RatingTier, peak_rating: int) -> Dict[str, Any]:
         """Get seasonal rewards based on tier achieved."""
-        rewards = {
-            RatingTier.BRONZE: {
-                "basic_hero_shards": 3,
-                "epic_hero_shards": 0,
-                "skill_points": 0,
-                "title": None
-            },
-            RatingTier.SILVER: {
-                "basic_hero_shards": 5,
-                "epic_hero_shards": 3,
-                "skill_points": 2,
-                "title": None
-            },
-            RatingTier.GOLD: {
-                "basic_hero_shards": 8,
-                "epic_hero_shards": 5,
-                "skill_points": 3,
-                "title": "Gold Duelist"
-            },
-            RatingTier.PLATINUM: {
-                "basic_hero_shards": 12,
-                "epic_hero_shards": 8,
-                "skill_points": 5,
-                "title": "Platinum Warrior"
-            },
-            RatingTier.DIAMOND: {
-                "basic_hero_shards": 18,
-                "epic_hero_shards": 12,
-                "skill_points": 8,
-                "title": "Diamond Champion"
-            },
-            RatingTier.MASTER: {
-                "basic_hero_shards": 25,
-                "epic_hero_shards": 18,
-                "skill_points": 12,
-                "title": "Grandmaster"
-            }
-        }
-        
-        base_rewards = rewards.get(tier, rewards[RatingTier.BRONZE])
-        
-        # Bonus rewards for high peak ratings
-        if peak_rating >= 2200:
-            base_rewards["epic_hero_shards"] += 5
-            base_rewards["skill_points"] += 3
-        elif peak_rating >= 2000:
-            base_rewards["epic_hero_shards"] += 3
-            base_rewards["skill_points"] += 2
-        
-        return base_rewards
+        if not isinstance(tier, RatingTier):
+            tier = RatingTier.BRONZE
+        return dict(_REWARD_TABLE[tier][bisect.bisect_right(_PEAK_BONUS_BOUNDS, peak_rating)])
     
     def get_matchmaking_range(self, rating: int, games_played: int) -> Tuple[int, int]:
         """Get rating range for matchmaking."""
@@ -272,36 +307,20 @@ class RatingSystem:
         """Calculate achievement progress based on duel stats."""
         achievements = []
         
-        total_duels = duel_stats.get("total_duels", 0)
-        duel_wins = duel_stats.get("duel_wins", 0)
-        current_streak = duel_stats.get("current_streak", 0)
-        best_streak = duel_stats.get("best_streak", 0)
-        duel_rating = duel_stats.get("duel_rating", self.starting_rating)
-        
-        # Achievement definitions
-        achievement_defs = [
-            {"id": "first_blood", "name": "First Blood", "desc": "Win your first duel", "target": 1, "current": min(1, duel_wins)},
-            {"id": "dueling_novice", "name": "Dueling Novice", "desc": "Play 10 duels", "target": 10, "current": total_duels},
-            {"id": "dueling_veteran", "name": "Dueling Veteran", "desc": "Play 50 duels", "target": 50, "current": total_duels},
-            {"id": "unstoppable", "name": "Unstoppable", "desc": "Win 5 duels in a row", "target": 5, "current": min(5, best_streak)},
-            {"id": "dominator", "name": "Dominator", "desc": "Win 10 duels in a row", "target": 10, "current": min(10, best_streak)},
-            {"id": "silver_rank", "name": "Silver Rank", "desc": "Reach Silver tier (1200 rating)", "target": 1200, "current": duel_rating},
-            {"id": "gold_rank", "name": "Gold Rank", "desc": "Reach Gold tier (1400 rating)", "target": 1400, "current": duel_rating},
-            {"id": "diamond_rank", "name": "Diamond Rank", "desc": "Reach Diamond tier (1800 rating)", "target": 1800, "current": duel_rating},
-        ]
-        
-        for ach in achievement_defs:
-            progress = min(100, (ach["current"] / ach["target"]) * 100)
-            completed = ach["current"] >= ach["target"]
+        for ach_id, name, desc, target, stat, cap in _ACHIEVEMENT_DEFS:
+            default = self.starting_rating if stat == "duel_rating" else 0
+            current = duel_stats.get(stat, default)
+            if cap is not None:
+                current = min(cap, current)
             
             achievements.append({
-                "id": ach["id"],
-                "name": ach["name"],
-                "description": ach["desc"],
-                "progress": progress,
-                "completed": completed,
-                "current": ach["current"],
-                "target": ach["target"]
+                "id": ach_id,
+                "name": name,
+                "description": desc,
+                "progress": min(100, (current / target) * 100),
+                "completed": current >= target,
+                "current": current,
+                "target": target
             })
         
         return achievements
@@ -7,13 +7,36 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, NamedTuple
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class Skill:
+# Element display emojis
+ELEMENT_EMOJIS = {
+    "fire": "🔥",
+    "water": "💧",
+    "earth": "🌍",
+    "air": "💨"
+}
+
+# Bonus types tracked by the skill tree, in SkillBonuses field order
+_BONUS_KEYS = (
+    "atk_bonus",
+    "def_bonus",
+    "hp_bonus",
+    "all_stats_bonus",
+    "crit_bonus",
+    "speed_bonus",
+    "evasion_bonus",
+    "hp_regen_bonus",
+    "dmg_reduction_bonus"
+)
+
+# Bit layout for packed skill trees: bit = element index * tiers + (tier - 1)
+_ELEMENT_INDEX = {"fire": 0, "water": 1, "earth": 2, "air": 3}
+_TIERS_PER_ELEMENT = 4
+
+class Skill(NamedTuple):
     """Represents a skill in the skill tree."""
     name: str
     tier: int
@@ -22,8 +45,7 @@ class Skill:
     bonuses: Dict[str, float]
     element: str
 
-@dataclass
-class SkillBonuses:
+class SkillBonuses(NamedTuple):
     """Aggregated skill bonuses."""
     atk_bonus: float = 0.0
     def_bonus: float = 0.0
@@ -73,6 +95,37 @@ class SkillManager:
                 4: Skill("Storm Mastery", 4, 5, "+25% All Stats", {"all_stats_bonus": 0.25}, "air")
             }
         }
+        
+        # Flattened bonuses keyed the same way as the stored skill tree
+        self._skill_bonus_items = {
+            (element, f"tier_{tier}"): tuple(skill.bonuses.items())
+            for element, element_skills in self.skills.items()
+            for tier, skill in element_skills.items()
+        }
+        
+        # Skill definitions are static, so their display text is formatted once
+        self._skill_descriptions = {
+            (element, tier): self._build_skill_description(skill)
+            for element, element_skills in self.skills.items()
+            for tier, skill in element_skills.items()
+        }
+        
+        # Mask bit and cost of every skill in the tree
+        self._skill_costs_by_bit = tuple(
+            (self._skill_bit(element, tier), skill.cost)
+            for element, element_skills in self.skills.items()
+            for tier, skill in element_skills.items()
+        )
+        
+        # Skills ordered by cost (ties keep tree order) with their mask bits
+        self._skills_by_cost = sorted(
+            (
+                (element, tier, skill, self._skill_bit(element, tier), self._skill_bit(element, tier - 1))
+                for element, element_skills in self.skills.items()
+                for tier, skill in element_skills.items()
+            ),
+            key=lambda entry: entry[2].cost
+        )
     
     def get_skill(self, element: str, tier: int) -> Optional[Skill]:
         """Get a specific skill by element and tier."""
@@ -82,6 +135,39 @@ class SkillManager:
         """Get all skills for an element."""
         return self.skills.get(element, {})
     
+    def _skill_bit(self, element: str, tier: int) -> int:
+        """Get the mask bit for an element tier, or 0 if it is not part of the tree."""
+        index = _ELEMENT_INDEX.get(element)
+        if index is None or not 1 <= tier <= _TIERS_PER_ELEMENT:
+            return 0
+        return 1 << (index * _TIERS_PER_ELEMENT + tier - 1)
+    
+    def skills_to_mask(self, current_skills: Dict[str, Dict[str, bool]]) -> int:
+        """Pack a stored skill tree into a 16-bit unlock mask."""
+        mask = 0
+        for element, element_skills in current_skills.items():
+            index = _ELEMENT_INDEX.get(element)
+            if index is None:
+                continue
+            for tier in range(1, _TIERS_PER_ELEMENT + 1):
+                if element_skills.get(f"tier_{tier}", False):
+                    mask |= 1 << (index * _TIERS_PER_ELEMENT + tier - 1)
+        return mask
+    
+    def mask_to_skills(self, mask: int) -> Dict[str, Dict[str, bool]]:
+        """Unpack an unlock mask into the stored skill tree format."""
+        return {
+            element: {
+                f"tier_{tier}": bool(mask >> (index * _TIERS_PER_ELEMENT + tier - 1) & 1)
+                for tier in range(1, _TIERS_PER_ELEMENT + 1)
+            }
+            for element, index in _ELEMENT_INDEX.items()
+        }
+    
+    def is_skill_unlocked(self, mask: int, element: str, tier: int) -> bool:
+        """Check a single skill against an unlock mask."""
+        return bool(mask & self._skill_bit(element, tier))
+    
     def can_unlock_skill(self, element: str, tier: int, current_skills: Dict[str, Dict[str, bool]], skill_points: int) -> Tuple[bool, str]:
         """Check if a skill can be unlocked."""
         skill = self.get_skill(element, tier)
@@ -146,99 +232,81 @@ class SkillManager:
     
     def calculate_total_bonuses(self, current_skills: Dict[str, Dict[str, bool]]) -> Dict[str, float]:
         """Calculate total bonuses from all unlocked skills."""
-        total_bonuses = {
-            "atk_bonus": 0.0,
-            "def_bonus": 0.0,
-            "hp_bonus": 0.0,
-            "all_stats_bonus": 0.0,
-            "crit_bonus": 0.0,
-            "speed_bonus": 0.0,
-            "evasion_bonus": 0.0,
-            "hp_regen_bonus": 0.0,
-            "dmg_reduction_bonus": 0.0
-        }
+        total_bonuses = dict.fromkeys(_BONUS_KEYS, 0.0)
+        bonus_items = self._skill_bonus_items.get
         
         for element, element_skills in current_skills.items():
             for tier_key, is_unlocked in element_skills.items():
                 if is_unlocked:
-                    tier = int(tier_key.split("_")[1])
-                    skill = self.get_skill(element, tier)
-                    if skill:
-                        for bonus_type, bonus_value in skill.bonuses.items():
-                            total_bonuses[bonus_type] += bonus_value
+                    for bonus_type, bonus_value in bonus_items((element, tier_key), ()):
+                        total_bonuses[bonus_type] += bonus_value
         
         return total_bonuses
     
-    def get_skill_tree_progress(self, current_skills: Dict[str, Dict[str, bool]]) -> Dict[str, Any]:
-        """Get progress statistics for skill trees."""
+    def get_skill_tree_progress(self, current_skills: Dict[str, Dict[str, bool]], verbose: bool = True) -> Dict[str, Any]:
+        """
+        Get progress statistics for skill trees.
+        
+        Args:
+            current_skills: Stored skill tree
+            verbose: Include the per-element "by_element" breakdown
+        """
+        mask = self.skills_to_mask(current_skills)
         progress = {
-            "total_unlocked": 0,
-            "total_available": 0,
+            "total_unlocked": bin(mask).count("1"),
+            "total_available": len(self._skill_costs_by_bit),
             "by_element": {},
-            "skill_points_spent": 0
+            "skill_points_spent": sum(cost for bit, cost in self._skill_costs_by_bit if mask & bit)
         }
         
-        for element in self.skills:
+        if not verbose:
+            return progress
+        
+        for element, element_skills in self.skills.items():
             element_progress = {
                 "unlocked": 0,
-                "total": len(self.skills[element]),
+                "total": len(element_skills),
                 "skills": []
             }
             
-            element_skills = current_skills.get(element, {})
-            for tier in range(1, 5):
-                skill = self.get_skill(element, tier)
-                is_unlocked = element_skills.get(f"tier_{tier}", False)
+            for tier, skill in element_skills.items():
+                is_unlocked = self.is_skill_unlocked(mask, element, tier)
+                element_progress["skills"].append({
+                    "tier": tier,
+                    "name": skill.name,
+                    "unlocked": is_unlocked,
+                    "cost": skill.cost,
+                    "description": skill.description
+                })
                 
-                if skill:
-                    element_progress["skills"].append({
-                        "tier": tier,
-                        "name": skill.name,
-                        "unlocked": is_unlocked,
-                        "cost": skill.cost,
-                        "description": skill.description
-                    })
-                    
-                    if is_unlocked:
-                        element_progress["unlocked"] += 1
-                        progress["skill_points_spent"] += skill.cost
+                if is_unlocked:
+                    element_progress["unlocked"] += 1
             
             progress["by_element"][element] = element_progress
-            progress["total_unlocked"] += element_progress["unlocked"]
-            progress["total_available"] += element_progress["total"]
         
         return progress
     
     def get_available_upgrades(self, current_skills: Dict[str, Dict[str, bool]], skill_points: int) -> List[Dict[str, Any]]:
         """Get list of skills that can be unlocked with current skill points."""
-        available = []
-        
-        for element in self.skills:
-            for tier in range(1, 5):
-                can_unlock, message = self.can_unlock_skill(element, tier, current_skills, skill_points)
-                if can_unlock:
-                    skill = self.get_skill(element, tier)
-                    if skill:
-                        available.append({
-                            "element": element,
-                            "tier": tier,
-                            "skill": skill,
-                            "cost": skill.cost
-                        })
+        mask = self.skills_to_mask(current_skills)
         
-        # Sort by cost (cheapest first)
-        available.sort(key=lambda x: x["cost"])
-        return available
+        # Already sorted by cost (cheapest first)
+        return [
+            {
+                "element": element,
+                "tier": tier,
+                "skill": skill,
+                "cost": skill.cost
+            }
+            for element, tier, skill, bit, prev_bit in self._skills_by_cost
+            if not mask & bit
+            and skill_points >= skill.cost
+            and (tier == 1 or mask & prev_bit)
+        ]
     
     def get_element_emoji(self, element: str) -> str:
         """Get emoji for an element."""
-        emoji_map = {
-            "fire": "🔥",
-            "water": "💧",
-            "earth": "🌍", 
-            "air": "💨"
-        }
-        return emoji_map.get(element, "⭐")
+        return ELEMENT_EMOJIS.get(element, "⭐")
     
     def get_tier_emoji(self, tier: int, unlocked: bool = False) -> str:
         """Get emoji for skill tier status."""
@@ -251,20 +319,22 @@ class SkillManager:
     
     def format_skill_description(self, skill: Skill) -> str:
         """Format skill description with bonuses."""
-        parts = [skill.description]
-        
-        if skill.bonuses:
-            bonus_parts = []
-            for bonus_type, value in skill.bonuses.items():
-                if value > 0:
-                    if bonus_type.endswith("_bonus"):
-                        stat_name = bonus_type.replace("_bonus", "").replace("_", " ").title()
-                        bonus_parts.append(f"+{value*100:.0f}% {stat_name}")
-            
-            if bonus_parts:
-                parts.append(f"({', '.join(bonus_parts)})")
+        cached = self._skill_descriptions.get((skill.element, skill.tier))
+        if cached is not None and self.get_skill(skill.element, skill.tier) is skill:
+            return cached
+        return self._build_skill_description(skill)
+    
+    def _build_skill_description(self, skill: Skill) -> str:
+        """Build the description text with a formatted bonus summary."""
+        bonus_parts = [
+            f"+{value*100:.0f}% {bonus_type[:-6].replace('_', ' ').title()}"
+            for bonus_type, value in skill.bonuses.items()
+            if value > 0 and bonus_type.endswith("_bonus")
+        ]
         
-        return " ".join(parts)
+        if bonus_parts:
+            return f"{skill.description} ({', '.join(bonus_parts)})"
+        return skill.description
     
     def get_default_skills(self) -> Dict[str, Dict[str, bool]]:
         """Get default skill tree state for new players."""
@@ -1,26 +1,60 @@
 """
 UI Components package for Avatar Realms Collide Discord Bot.
 Contains all interactive UI components like modals, dropdowns, and views.
+
+Submodules are imported lazily on first attribute access so that loading
+one component does not pull in the others.
 """
 
-from .modals import TownHallModal
-from .dropdowns import ElementSelectDropdown, SkillPriorityElementDropdown, TownHallDropdown
-from .views import (
-    CharacterSelectView, 
-    SkillPriorityHeroView, 
-    LeaderboardView, 
-    TownHallView, 
-    HeroRankupView
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .modals import TownHallModal
+    from .dropdowns import ElementSelectDropdown, SkillPriorityElementDropdown, TownHallDropdown
+    from .views import (
+        CharacterSelectView,
+        SkillPriorityHeroView,
+        LeaderboardView,
+        TownHallView,
+        HeroRankupView
+    )
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'TownHallModal': '.modals',
+    'ElementSelectDropdown': '.dropdowns',
+    'SkillPriorityElementDropdown': '.dropdowns',
+    'TownHallDropdown': '.dropdowns',
+    'CharacterSelectView': '.views',
+    'SkillPriorityHeroView': '.views',
+    'LeaderboardView': '.views',
+    'TownHallView': '.views',
+    'HeroRankupView': '.views'
+}
 
 __all__ = [
     'TownHallModal',
     'ElementSelectDropdown',
-    'SkillPriorityElementDropdown', 
+    'SkillPriorityElementDropdown',
     'TownHallDropdown',
     'CharacterSelectView',
     'SkillPriorityHeroView',
     'LeaderboardView',
     'TownHallView',
     'HeroRankupView'
-] 
\ No newline at end of file
+]
+
+def __getattr__(name):
+    """Import a component's submodule on first access and cache the attribute."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """List lazily imported components alongside loaded attributes."""
+    return sorted(set(globals()) | set(__all__))
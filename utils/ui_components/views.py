@@ -3,46 +3,139 @@ View components for Avatar Realms Collide Discord Bot.
 Contains interactive view components with buttons and layouts.
 """
 
+import asyncio
+import functools
 import discord
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from pathlib import Path
 from utils.data_parser import DataParser
+from .modals import TOWN_HALL_DATA
 import re
 
+# Embed colors, created once
+_RED = discord.Color.red()
+_BLUE = discord.Color.blue()
+_PURPLE = discord.Color.purple()
+_DARK_GREEN = discord.Color.dark_green()
+_LIGHT_GREY = discord.Color.light_grey()
+
+# Embed colors by element
+_ELEMENT_COLORS = {
+    "Fire": _RED,
+    "Water": _BLUE,
+    "Earth": _DARK_GREEN,
+    "Air": _LIGHT_GREY
+}
+
+# Emojis by element
+_ELEMENT_EMOJIS = {
+    "Fire": "🔥",
+    "Water": "💧",
+    "Earth": "🌍",
+    "Air": "💨"
+}
+
+# Emojis by character rarity
+_RARITY_EMOJIS = {
+    "Rare": "🔵",
+    "Epic": "🟣",
+    "Legendary": "🟡"
+}
+
+# Ranking text files read by the leaderboard paginators
+_LEADER_RANKS_PATH = Path("text files/leader-ranks.txt")
+_ALLIANCE_RANKS_PATH = Path("text files/alliance-ranks.txt")
+
+# Date tokens (MM/DD/YYYY or M/D/YYYY) in rank file headers
+_DATE_RE = re.compile(r"(\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b)")
+
+# Parsed rank files: path -> ((mtime_ns, size), parsed result)
+_RANK_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Optional[List[str]]]]] = {}
+
+def _build_talent_browser_embed() -> discord.Embed:
+    """Build the talent tree browser's element selection embed."""
+    embed = discord.Embed(
+        title="🌟 Welcome to the Talent Tree Browser",
+        description="Choose your element to discover characters and their talent trees.",
+        color=discord.Color.from_rgb(52, 152, 219)
+    )
+    
+    embed.add_field(
+        name="🎯 Available Elements",
+        value="**🔥 Fire** • **💧 Water** • **🌍 Earth** • **💨 Air**",
+        inline=False
+    )
+    
+    embed.add_field(
+        name="📊 Character Rarities",
+        value="**🔵 Rare** • **🟣 Epic** • **🟡 Legendary**",
+        inline=False
+    )
+    
+    embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends) • Pick your element to begin your journey")
+    return embed
+
+# Static element selection embed shown by the back button (shared, never mutated)
+_TALENT_BROWSER_EMBED = _build_talent_browser_embed()
+
+def get_element_color(element: str, default: discord.Color = _BLUE) -> discord.Color:
+    """Get the appropriate color for each element."""
+    return _ELEMENT_COLORS.get(element, default)
+
+def get_element_emoji(element: str) -> str:
+    """Get emoji for element."""
+    return _ELEMENT_EMOJIS.get(element, "❓")
+
+def get_rarity_emoji(rarity: str) -> str:
+    """Get emoji for character rarity."""
+    return _RARITY_EMOJIS.get(rarity, "🔵")
+
+def _add_name_buttons(view: discord.ui.View, names: List[str], prefix: str, callback) -> Dict[str, str]:
+    """Add one primary button per name (max 25 per Discord limit) and return names by custom_id."""
+    names_by_custom_id: Dict[str, str] = {}
+    for name in names[:25]:
+        custom_id = f"{prefix}_{name.lower().replace(' ', '_')}"
+        names_by_custom_id[custom_id] = name
+        button = discord.ui.Button(
+            label=name,
+            style=discord.ButtonStyle.primary,
+            custom_id=custom_id
+        )
+        button.callback = callback
+        view.add_item(button)
+    return names_by_custom_id
+
 class CharacterSelectView(discord.ui.View):
     """View for selecting characters with buttons."""
     
+    # Rendered talent replies shared by all views:
+    # character name -> (parser bundle, (embeds, attachments))
+    _talent_replies: Dict[str, Tuple[Dict[str, Any], Tuple]] = {}
+    
     def __init__(self, data_parser: DataParser, characters: List[Dict]):
         super().__init__(timeout=60)
         self.data_parser = data_parser
         self.characters = characters
         
-        # Add character buttons (max 25 buttons per Discord limit)
-        for i, char in enumerate(characters[:25]):  # Limit to 25 buttons
-            button = discord.ui.Button(
-                label=char['name'],
-                style=discord.ButtonStyle.primary,
-                custom_id=f"char_{char['name'].lower().replace(' ', '_')}"
-            )
-            button.callback = self.create_character_callback(char['name'])
-            self.add_item(button)
+        # Add character buttons; names by custom_id are read by the shared callback
+        self._names_by_custom_id = _add_name_buttons(
+            self, [char['name'] for char in characters[:25]], "char", self._character_callback
+        )
         
-    def create_character_callback(self, character_name: str):
-        """Create a callback function for a character button."""
-        async def callback(interaction: discord.Interaction):
-            await self.show_character_talents(interaction, character_name)
-        return callback
+    async def _character_callback(self, interaction: discord.Interaction):
+        """Show talents for the character whose button was pressed."""
+        character_name = self._names_by_custom_id[interaction.data['custom_id']]
+        await self.show_character_talents(interaction, character_name)
         
     async def show_character_talents(self, interaction: discord.Interaction, character_name: str):
         """Show talent trees for the selected character."""
-        # Get character information
-        character = self.data_parser.get_character(character_name)
-        
-        # Get talent type information
-        talent_type_info = self.data_parser.get_talent_type_info(character_name)
+        # Acknowledge first: the lookups and file opens below touch the disk and
+        # must not push the response past Discord's 3 second deadline
+        await interaction.response.defer()
         
-        # Get talent tree images
-        talent_images = self.data_parser.get_talent_tree_images(character_name)
+        # Get character record, talent type and talent tree images in one lookup
+        bundle = self.data_parser.get_character_bundle(character_name)
+        talent_images = bundle['images']
         
         if not talent_images:
             embed = discord.Embed(
@@ -50,35 +143,65 @@ class CharacterSelectView(discord.ui.View):
                 description=f"Sorry! We don't have talent trees available for {character_name} yet. They're still in development!",
                 color=discord.Color.dark_red()
             )
-            await interaction.response.edit_message(embed=embed, view=None)
+            await interaction.edit_original_response(embed=embed, view=None)
             return
         
+        # Reuse the rendered reply while the parser still hands out the same bundle
+        cached = self._talent_replies.get(character_name)
+        if cached is None or cached[0] is not bundle:
+            reply = self._build_talent_reply(character_name, bundle)
+            cached = (bundle, reply)
+            self._talent_replies[character_name] = cached
+        embeds, attachments = cached[1]
+        
+        # Open the image files concurrently off the event loop
+        files = await self._open_files(attachments)
+        
+        # Send all embeds and attachments in one request
+        if files:
+            await interaction.followup.send(embeds=list(embeds), files=files)
+        else:
+            await interaction.edit_original_response(embed=embeds[0], view=None)
+    
+    def _build_talent_reply(
+        self,
+        character_name: str,
+        bundle: Dict[str, Any],
+    ) -> Tuple[Tuple[discord.Embed, ...], Tuple[Tuple[str, str], ...]]:
+        """Build the talent tree embeds and their (path, filename) attachments."""
+        character = bundle['character']
+        talent_type_info = bundle['talent_type']
+        talent_images = bundle['images']
+        
+        # Element color shared by every embed in the reply
+        color = get_element_color(character.get('element', 'Unknown') if character else 'Unknown')
+        
         # Create comprehensive embed with character information
         embed = discord.Embed(
             title=f"🌟 {character_name}",
-            description=character.get('description', ''),
-            color=self.get_element_color(character.get('element', 'Unknown'))
+            description=character.get('description', '') if character else '',
+            color=color
         )
         
         # Add character information if available
         if character:
             # Create clean stats section
-            stats_text = ""
+            stats_lines = []
             if 'rarity' in character:
-                rarity_emoji = self.get_rarity_emoji(character['rarity'])
-                stats_text += f"{rarity_emoji} **{character['rarity']}**\n"
+                rarity_emoji = get_rarity_emoji(character['rarity'])
+                stats_lines.append(f"{rarity_emoji} **{character['rarity']}**")
             
             if 'element' in character:
-                element_emoji = self.get_element_emoji(character['element'])
-                stats_text += f"{element_emoji} **{character['element']}**\n"
+                element_emoji = get_element_emoji(character['element'])
+                stats_lines.append(f"{element_emoji} **{character['element']}**")
             
             if 'category' in character:
-                stats_text += f"**{character['category']}**\n"
+                stats_lines.append(f"**{character['category']}**")
             
-            if stats_text:
+            if stats_lines:
                 embed.add_field(
                     name="📊 Character Stats",
-                    value=stats_text,
+                    value="\n".join(stats_lines),
                     inline=True
                 )
         
@@ -92,94 +215,48 @@ class CharacterSelectView(discord.ui.View):
         
         embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
         
-        # Create a comprehensive embed with both talent tree images
-        files = []
+        # Deliver every talent tree in a single message: the first tree is the
+        # main embed's image, the second gets its own embed
+        embeds = [embed]
+        attachments = []
         
-        # Add first talent tree as main image
         if talent_images.get('talent_tree_1'):
-            file1 = discord.File(talent_images['talent_tree_1'], filename=Path(talent_images['talent_tree_1']).name)
-            embed.set_image(url=f"attachment://{Path(talent_images['talent_tree_1']).name}")
-            files.append(file1)
+            name1 = Path(talent_images['talent_tree_1']).name
+            attachments.append((talent_images['talent_tree_1'], name1))
+            embed.set_image(url=f"attachment://{name1}")
             
             # Add second talent tree as a second embed
             if talent_images.get('talent_tree_2'):
-                file2 = discord.File(talent_images['talent_tree_2'], filename=Path(talent_images['talent_tree_2']).name)
-                files.append(file2)
+                name2 = Path(talent_images['talent_tree_2']).name
+                attachments.append((talent_images['talent_tree_2'], name2))
                 
-                # Create a second embed for the second talent tree
                 embed2 = discord.Embed(
                     title=f"🌳 {character_name}'s Second Talent Tree",
-                    color=self.get_element_color(character.get('element', 'Unknown'))
+                    color=color
                 )
-                embed2.set_image(url=f"attachment://{Path(talent_images['talent_tree_2']).name}")
+                embed2.set_image(url=f"attachment://{name2}")
                 embed2.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-                
-                # Send both embeds in one message
-                await interaction.response.send_message(embeds=[embed, embed2], files=files)
-                return
+                embeds.append(embed2)
         
-        # Send single message with embed containing the images
-        if files:
-            await interaction.response.send_message(embed=embed, files=files)
-        else:
-            await interaction.response.edit_message(embed=embed, view=None)
-    
-    def get_element_color(self, element: str) -> discord.Color:
-        """Get the appropriate color for each element."""
-        colors = {
-            "Fire": discord.Color.red(),
-            "Water": discord.Color.blue(),
-            "Earth": discord.Color.dark_green(),
-            "Air": discord.Color.light_grey()
-        }
-        return colors.get(element, discord.Color.blue())
+        # Discord allows up to 10 embeds per message
+        return tuple(embeds[:10]), tuple(attachments)
     
-    def get_element_emoji(self, element: str) -> str:
-        """Get emoji for element."""
-        element_emojis = {
-            "Fire": "🔥",
-            "Water": "💧",
-            "Earth": "🌍",
-            "Air": "💨"
-        }
-        return element_emojis.get(element, "❓")
-    
-    def get_rarity_emoji(self, rarity: str) -> str:
-        """Get emoji for character rarity."""
-        rarity_emojis = {
-            "Rare": "🔵",
-            "Epic": "🟣",
-            "Legendary": "🟡"
-        }
-        return rarity_emojis.get(rarity, "🔵")
+    @staticmethod
+    async def _open_files(attachments: List[Tuple[str, str]]) -> List[discord.File]:
+        """Open (path, filename) attachments in the default executor, in parallel."""
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(None, functools.partial(discord.File, path, filename=filename))
+            for path, filename in attachments
+        )))
     
     @discord.ui.button(label="⬅️ Back to Elements", style=discord.ButtonStyle.secondary, emoji="⬅️")
     async def back_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Go back to element selection."""
-        embed = discord.Embed(
-            title="🌟 Welcome to the Talent Tree Browser",
-            description="Choose your element to discover characters and their talent trees.",
-            color=discord.Color.from_rgb(52, 152, 219)
-        )
-        
-        embed.add_field(
-            name="🎯 Available Elements",
-            value="**🔥 Fire** • **💧 Water** • **🌍 Earth** • **💨 Air**",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 Character Rarities",
-            value="**🔵 Rare** • **🟣 Epic** • **🟡 Legendary**",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends) • Pick your element to begin your journey")
-        
         view = discord.ui.View(timeout=60)
         from .dropdowns import ElementSelectDropdown
         view.add_item(ElementSelectDropdown(self.data_parser))
-        await interaction.response.edit_message(embed=embed, view=view)
+        await interaction.response.edit_message(embed=_TALENT_BROWSER_EMBED, view=view)
 
 class SkillPriorityHeroView(discord.ui.View):
     """View for selecting heroes with skill priorities."""
@@ -189,26 +266,25 @@ class SkillPriorityHeroView(discord.ui.View):
         self.data_parser = data_parser
         self.heroes = heroes
         
-        # Add hero buttons (max 25 buttons per Discord limit)
-        for hero_name in heroes[:25]:  # Limit to 25 buttons
-            button = discord.ui.Button(
-                label=hero_name,
-                style=discord.ButtonStyle.primary,
-                custom_id=f"skill_{hero_name.lower().replace(' ', '_')}"
-            )
-            button.callback = self.create_hero_callback(hero_name)
-            self.add_item(button)
+        # Add hero buttons; names by custom_id are read by the shared callback
+        self._names_by_custom_id = _add_name_buttons(self, heroes, "skill", self._hero_callback)
     
-    def create_hero_callback(self, hero_name: str):
-        """Create a callback function for a hero button."""
-        async def callback(interaction: discord.Interaction):
-            await self.show_skill_priorities(interaction, hero_name)
-        return callback
+    async def _hero_callback(self, interaction: discord.Interaction):
+        """Show skill priorities for the hero whose button was pressed."""
+        hero_name = self._names_by_custom_id[interaction.data['custom_id']]
+        await self.show_skill_priorities(interaction, hero_name)
     
     async def show_skill_priorities(self, interaction: discord.Interaction, hero_name: str):
         """Show skill priorities for the selected hero."""
-        skill_priorities = self.data_parser.get_skill_priorities()
-        hero_data = skill_priorities.get(hero_name)
+        # Cold caches read from disk, so acknowledge within Discord's 3s window first
+        if self.data_parser.is_warm():
+            respond = interaction.response.edit_message
+        else:
+            await interaction.response.defer()
+            self.data_parser.warm_indexes()
+            respond = interaction.edit_original_response
+        
+        hero_data = self.data_parser.get_skill_priorities().get(hero_name)
         
         if not hero_data:
             embed = discord.Embed(
@@ -216,7 +292,7 @@ class SkillPriorityHeroView(discord.ui.View):
                 description=f"Sorry! Skill priorities for {hero_name} are not available yet.",
                 color=discord.Color.dark_red()
             )
-            await interaction.response.edit_message(embed=embed, view=None)
+            await respond(embed=embed, view=None)
             return
         
         # Get character info for additional details
@@ -226,20 +302,17 @@ class SkillPriorityHeroView(discord.ui.View):
         embed = discord.Embed(
             title=f"🎯 {hero_name}",
             description="Skill priority order",
-            color=self.get_element_color(character.get('element', 'Unknown') if character else 'Unknown')
+            color=get_element_color(character.get('element', 'Unknown') if character else 'Unknown', _PURPLE)
         )
         
         # Add skill priorities
         skills = hero_data['skills']
-        skills_text = ""
-        for i, skill in enumerate(skills, 1):
-            skills_text += f"**{i}.** {skill}\n"
-        
-        embed.add_field(
-            name="⚔️ Skill Order",
-            value=skills_text,
-            inline=False
-        )
+        if skills:
+            embed.add_field(
+                name="⚔️ Skill Order",
+                value="\n".join(f"**{i}.** {skill}" for i, skill in enumerate(skills, 1)),
+                inline=False
+            )
         
         # Add notes if available
         if hero_data.get('notes'):
@@ -251,17 +324,7 @@ class SkillPriorityHeroView(discord.ui.View):
         
         embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends) • Skill priorities for optimal progression")
         
-        await interaction.response.edit_message(embed=embed, view=None)
-    
-    def get_element_color(self, element: str) -> discord.Color:
-        """Get the appropriate color for each element."""
-        colors = {
-            "Fire": discord.Color.red(),
-            "Water": discord.Color.blue(),
-            "Earth": discord.Color.dark_green(),
-            "Air": discord.Color.light_grey()
-        }
-        return colors.get(element, discord.Color.purple())
+        await respond(embed=embed, view=None)
 
 class LeaderboardView(discord.ui.View):
     """View for leaderboard selection."""
@@ -270,39 +333,56 @@ class LeaderboardView(discord.ui.View):
         super().__init__(timeout=60)
     
     # ---------- Internal helpers for text-based, paginated leaderboards ----------
-    def _read_rank_file(self, file_path: Path) -> Dict[str, Optional[List[str]]]:
+    async def _read_rank_file(self, file_path: Path) -> Dict[str, Optional[List[str]]]:
         """
-        Read a rankings text file and return header, date (if present), and entries.
+        Read a rankings text file and return header, date (if present), entries and pages.
         Entries are lines that begin with a rank number like "1." or " 1.".
+        Results are cached per file until its modification time or size changes;
+        callers must not mutate them.
         """
-        result: Dict[str, Optional[List[str]]]= {"header": None, "date": None, "entries": []}
-        if not file_path.exists():
-            return result
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = [line.rstrip() for line in content.splitlines()]
-            if not lines:
-                return result
-            # First non-empty line as header
-            for line in lines:
-                if line.strip():
-                    result["header"] = line.strip()
-                    # Extract date-like token (MM/DD/YYYY or M/D/YYYY) if present
-                    m = re.search(r"(\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b)", line)
-                    result["date"] = m.group(1) if m else None
-                    break
-            # Collect ranked entries
-            entry_pattern = re.compile(r"^\s*\d+\.")
-            entries: List[str] = []
-            for line in lines:
-                if entry_pattern.match(line):
-                    # Normalize dashes for better readability
-                    normalized = line.replace("–", "—").replace("-", "-")
-                    entries.append(normalized.strip())
-            result["entries"] = entries
-            return result
+            stat = file_path.stat()
+        except OSError:
+            return {"header": None, "date": None, "entries": [], "pages": []}
+        
+        # Validator for the cached parse, like an HTTP ETag
+        etag = (stat.st_mtime_ns, stat.st_size)
+        cached = _RANK_CACHE.get(file_path)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
+        
+        result: Dict[str, Optional[List[str]]]= {"header": None, "date": None, "entries": [], "pages": []}
+        try:
+            # Read in the default executor so a cache miss does not block the event loop
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(
+                None, functools.partial(file_path.read_text, encoding="utf-8", errors="ignore")
+            )
         except Exception:
             return result
+        lines = [line.rstrip() for line in content.splitlines()]
+        # First non-empty line as header
+        for line in lines:
+            if line.strip():
+                result["header"] = line.strip()
+                # Extract date-like token (MM/DD/YYYY or M/D/YYYY) if present
+                m = _DATE_RE.search(line)
+                result["date"] = m.group(1) if m else None
+                break
+        # Collect ranked entries
+        entries: List[str] = []
+        for line in lines:
+            # Ranked lines start with digits followed by a dot, e.g. "12."
+            stripped = line.lstrip()
+            dot = stripped.find(".")
+            if dot > 0 and stripped[:dot].isdigit():
+                # Normalize dashes for better readability
+                entries.append(stripped.replace("–", "—"))
+        result["entries"] = entries
+        result["pages"] = self._chunk_entries(entries, page_size=20)
+        
+        _RANK_CACHE[file_path] = (etag, result)
+        return result
     
     def _chunk_entries(self, entries: List[str], page_size: int = 20) -> List[List[str]]:
         return [entries[i:i+page_size] for i in range(0, len(entries), page_size)]
@@ -318,33 +398,25 @@ class LeaderboardView(discord.ui.View):
         footer_note: Optional[str] = None,
         updated_date: Optional[str] = None,
     ) -> discord.Embed:
-        description_lines: List[str] = []
-        if header:
-            description_lines.append(header)
-            description_lines.append("")
         if entries_page:
             # Use a code block to align monospaced lines for readability
-            block = "\n".join(entries_page)
-            description_lines.append(f"```\n{block}\n```")
+            body = "```\n" + "\n".join(entries_page) + "\n```"
         else:
-            description_lines.append("No entries found.")
-        embed = discord.Embed(title=title, description="\n".join(description_lines), color=color)
-        page_text = f"Page {page_index+1}/{total_pages}"
-        footer_parts: List[str] = []
-        if footer_note:
-            footer_parts.append(footer_note)
+            body = "No entries found."
+        description = f"{header}\n\n{body}" if header else body
+        embed = discord.Embed(title=title, description=description, color=color)
+        footer = f"Page {page_index+1}/{total_pages}"
         if updated_date:
-            footer_parts.append(f"Updated {updated_date}")
-        footer_parts.append(page_text)
-        embed.set_footer(text=" • ".join(footer_parts))
+            footer = f"Updated {updated_date} • {footer}"
+        if footer_note:
+            footer = f"{footer_note} • {footer}"
+        embed.set_footer(text=footer)
         return embed
 
     # ---------- Public builders to reuse in commands ----------
-    def build_leader_paginator(self) -> "LeaderboardView._Paginator":
-        txt_path = Path("text files/leader-ranks.txt")
-        data = self._read_rank_file(txt_path)
-        entries = data.get("entries") or []
-        pages = self._chunk_entries(entries, page_size=20)
+    async def build_leader_paginator(self) -> "LeaderboardView._Paginator":
+        data = await self._read_rank_file(_LEADER_RANKS_PATH)
+        pages = data.get("pages") or []
         return self._Paginator(
             self,
             title="👑 Leader Rankings",
@@ -355,11 +427,9 @@ class LeaderboardView(discord.ui.View):
             updated_date=data.get("date"),
         )
 
-    def build_alliance_paginator(self) -> "LeaderboardView._Paginator":
-        txt_path = Path("text files/alliance-ranks.txt")
-        data = self._read_rank_file(txt_path)
-        entries = data.get("entries") or []
-        pages = self._chunk_entries(entries, page_size=20)
+    async def build_alliance_paginator(self) -> "LeaderboardView._Paginator":
+        data = await self._read_rank_file(_ALLIANCE_RANKS_PATH)
+        pages = data.get("pages") or []
         return self._Paginator(
             self,
             title="🤝 Alliance Rankings",
@@ -390,18 +460,24 @@ class LeaderboardView(discord.ui.View):
             self.footer_note = footer_note
             self.updated_date = updated_date
             self.index = 0
+            # Rendered embeds by page index; pages never change, so flips reuse them
+            self._page_embeds: Dict[int, discord.Embed] = {}
         
         def current_embed(self) -> discord.Embed:
-            return self.parent._build_page_embed(
-                self.title,
-                self.header,
-                self.pages[self.index] if self.pages else [],
-                self.color,
-                self.index,
-                len(self.pages) if self.pages else 1,
-                self.footer_note,
-                self.updated_date,
-            )
+            embed = self._page_embeds.get(self.index)
+            if embed is None:
+                embed = self.parent._build_page_embed(
+                    self.title,
+                    self.header,
+                    self.pages[self.index] if self.pages else [],
+                    self.color,
+                    self.index,
+                    len(self.pages) if self.pages else 1,
+                    self.footer_note,
+                    self.updated_date,
+                )
+                self._page_embeds[self.index] = embed
+            return embed
         
         @discord.ui.button(label="Prev", style=discord.ButtonStyle.secondary, emoji="⬅️")
         async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -427,7 +503,7 @@ class LeaderboardView(discord.ui.View):
     async def top_leaders_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show leaders leaderboard from text with pagination."""
         try:
-            paginator = self.build_leader_paginator()
+            paginator = await self.build_leader_paginator()
             if not paginator.pages:
                 embed = discord.Embed(
                     title="❌ Leaderboard Not Available",
@@ -452,7 +528,7 @@ class LeaderboardView(discord.ui.View):
     async def top_alliances_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show alliances leaderboard from text with pagination."""
         try:
-            paginator = self.build_alliance_paginator()
+            paginator = await self.build_alliance_paginator()
             if not paginator.pages:
                 embed = discord.Embed(
                     title="❌ Leaderboard Not Available",
@@ -476,52 +552,108 @@ class LeaderboardView(discord.ui.View):
 class TownHallView(discord.ui.View):
     """View for town hall level selection."""
     
+    # Level selection options, one per known level, built once at import
+    TOWN_HALL_OPTIONS = tuple(
+        discord.SelectOption(
+            label=f"Town Hall {level}",
+            description=f"Level {level} requirements",
+            value=str(level)
+        )
+        for level in TOWN_HALL_DATA
+    )
+    
     def __init__(self):
         super().__init__(timeout=60)
         
-        # Town hall data
-        self.town_hall_data = {
-            3: {"food": "2.3K", "wood": "2.3K", "stone": "700", "time": "15s"},
-            4: {"food": "3.7K", "wood": "3.7K", "stone": "1.0K", "time": "40s"},
-            5: {"food": "6.7K", "wood": "6.7K", "stone": "3.0K", "time": "2m"},
-            6: {"food": "12.0K", "wood": "12.0K", "stone": "7.2K", "time": "5m"},
-            7: {"food": "16.8K", "wood": "16.8K", "stone": "10.1K", "time": "50m"},
-            8: {"food": "23.5K", "wood": "23.5K", "stone": "14.1K", "time": "2h 30m"},
-            9: {"food": "32.9K", "wood": "32.9K", "stone": "19.7K", "time": "5h"},
-            10: {"food": "47.4K", "wood": "47.4K", "stone": "28.4K", "time": "7h 20m"},
-            11: {"food": "68.3K", "wood": "68.3K", "stone": "41.0K", "time": "12h"},
-            12: {"food": "98.4K", "wood": "98.4K", "stone": "59.0K", "time": "13h 12m"},
-            13: {"food": "142.0K", "wood": "142.0K", "stone": "85.2K", "time": "14h 31m 10s"},
-            14: {"food": "204.0K", "wood": "204.0K", "stone": "122.0K", "time": "1d 3h 35m 10s"},
-            15: {"food": "298.0K", "wood": "298.0K", "stone": "179.0K", "time": "1d 9h 6m 10s"},
-            16: {"food": "435.0K", "wood": "435.0K", "stone": "261.0K", "time": "1d 15h 43m 20s"},
-            17: {"food": "635.0K", "wood": "635.0K", "stone": "381.0K", "time": "1d 19h 41m 40s"},
-            18: {"food": "927.0K", "wood": "927.0K", "stone": "556.0K", "time": "2d 3m 50s"},
-            19: {"food": "1.4M", "wood": "1.4M", "stone": "840.0K", "time": "2d 4h 52m 10s"},
-            20: {"food": "2.0M", "wood": "2.0M", "stone": "1.2M", "time": "3d 2h 1m"},
-            21: {"food": "2.9M", "wood": "2.9M", "stone": "1.7M", "time": "3d 16h 49m 10s"},
-            22: {"food": "4.3M", "wood": "4.3M", "stone": "2.6M", "time": "4d 10h 35m"},
-            23: {"food": "6.3M", "wood": "6.3M", "stone": "3.8M", "time": "5d 7h 54m"},
-            24: {"food": "9.3M", "wood": "9.3M", "stone": "5.6M", "time": "6d 9h 28m 50s"},
-            25: {"food": "13.7M", "wood": "13.7M", "stone": "8.2M", "time": "8d 22h 52m 20s"},
-            26: {"food": "20.3M", "wood": "20.3M", "stone": "12.2M", "time": "16d 2h 46m 10s"},
-            27: {"food": "30.0M", "wood": "30.0M", "stone": "18.0M", "time": "20d 22h 48m"},
-            28: {"food": "44.4M", "wood": "44.4M", "stone": "26.6M", "time": "27d 5h 38m 20s"},
-            29: {"food": "65.7M", "wood": "65.7M", "stone": "39.4M", "time": "46d 7h 11m 10s"},
-            30: {"food": "98.6M", "wood": "98.6M", "stone": "59.2M", "time": "148d 3h 47m 40s"}
-        }
-        
-        # Add level selection dropdown
-        options = []
-        for level in range(3, 31):
-            options.append(discord.SelectOption(
-                label=f"Town Hall {level}",
-                description=f"Level {level} requirements",
-                value=str(level)
-            ))
-        
         from .dropdowns import TownHallDropdown
-        self.add_item(TownHallDropdown(self.town_hall_data, options))
+        self.add_item(TownHallDropdown(list(self.TOWN_HALL_OPTIONS)))
+
+# Hero rankup guide pages: key -> (title, description, color, ((field name, value), ...))
+_RANKUP_PAGES = {
+    "unlock": (
+        "🔓 Hero Unlock",
+        "Information for unlocking a hero",
+        discord.Color.green(),
+        (
+            ("Cost", "**10 shards** - Unlock hero"),
+            ("Total Shards Used", "**10 shards**")
+        )
+    ),
+    "1": (
+        "⭐ 1 Star (Level 1-10)",
+        "Information for 1 star rankup",
+        discord.Color.blue(),
+        (
+            ("Cost Breakdown", "**1 shard** - 1/5 star\n**1 shard** - 2/5 star\n**1 shard** - 3/5 star\n**2 shards** - 4/5 star\n**3 shards** - Complete 1 star"),
+            ("Total Shards Used", "**18 shards** (10 unlock + 8 for 1 star)")
+        )
+    ),
+    "2": (
+        "⭐ 2 Stars (Level 20)",
+        "Information for 2 star rankup",
+        discord.Color.purple(),
+        (
+            ("Cost Breakdown", "**3 shards** - 1+1/5 star\n**3 shards** - 1+2/5 star\n**3 shards** - 1+3/5 star\n**5 shards** - 1+4/5 star\n**8 shards** - Complete 2 stars"),
+            ("Total Shards Used", "**40 shards** (10 unlock + 8 for 1 star + 22 for 2 stars)")
+        )
+    ),
+    "3": (
+        "⭐ 3 Stars (Level 30)",
+        "Information for 3 star rankup",
+        discord.Color.orange(),
+        (
+            ("Cost Breakdown", "**8 shards** - 2+1/5 star\n**8 shards** - 2+2/5 star\n**8 shards** - 2+3/5 star\n**12 shards** - 2+4/5 star\n**20 shards** - Complete 3 stars"),
+            ("Total Shards Used", "**96 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars)")
+        )
+    ),
+    "4": (
+        "⭐ 4 Stars (Level 40)",
+        "Information for 4 star rankup",
+        discord.Color.red(),
+        (
+            ("Cost Breakdown", "**20 shards** - 3+1/5 star\n**20 shards** - 3+2/5 star\n**20 shards** - 3+3/5 star\n**30 shards** - 3+4/5 star\n**50 shards** - Complete 4 stars"),
+            ("Total Shards Used", "**236 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars)")
+        )
+    ),
+    "5": (
+        "⭐ 5 Stars (Level 50)",
+        "Information for 5 star rankup",
+        discord.Color.gold(),
+        (
+            ("Cost Breakdown", "**50 shards** - 4+1/5 star\n**50 shards** - 4+2/5 star\n**50 shards** - 4+3/5 star\n**60 shards** - 4+4/5 star\n**80 shards** - Complete 5 stars"),
+            ("Total Shards Used", "**526 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars + 290 for 5 stars)")
+        )
+    ),
+    "6": (
+        "⭐ 6 Stars (Level 60)",
+        "Information for 6 star rankup",
+        discord.Color.dark_purple(),
+        (
+            ("Cost Breakdown", "**140 shards** - Complete 6 stars"),
+            ("Total Shards Used", "**966 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars + 290 for 5 stars + 140 for 6 stars)")
+        )
+    ),
+    "total": (
+        "💰 Total Hero Rankup Cost",
+        "Complete cost breakdown from unlock to 6 stars",
+        discord.Color.dark_green(),
+        (
+            ("Cost Breakdown", "🔓 **Unlock**: 10 shards\n⭐ **1 Star**: 18 shards\n⭐⭐ **2 Stars**: 40 shards\n⭐⭐⭐ **3 Stars**: 96 shards\n⭐⭐⭐⭐ **4 Stars**: 236 shards\n⭐⭐⭐⭐⭐ **5 Stars**: 526 shards\n⭐⭐⭐⭐⭐⭐ **6 Stars**: 966 shards"),
+            ("💰 Total Cost", "**966 Spirit Shards** - Total cost from unlock to 6 stars")
+        )
+    )
+}
+
+def _build_rankup_embed(title: str, description: str, color: discord.Color, fields) -> discord.Embed:
+    """Build one hero rankup guide page."""
+    embed = discord.Embed(title=title, description=description, color=color)
+    for name, value in fields:
+        embed.add_field(name=name, value=value, inline=False)
+    embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
+    return embed
+
+# Static rankup embeds, built once and shared by every view (never mutated)
+_RANKUP_EMBEDS = {key: _build_rankup_embed(*page) for key, page in _RANKUP_PAGES.items()}
 
 class HeroRankupView(discord.ui.View):
     """View for interactive hero rankup guide."""
@@ -532,199 +664,39 @@ class HeroRankupView(discord.ui.View):
     @discord.ui.button(label="🔓 Unlock", style=discord.ButtonStyle.secondary)
     async def unlock_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show unlock information."""
-        embed = discord.Embed(
-            title="🔓 Hero Unlock",
-            description="Information for unlocking a hero",
-            color=discord.Color.green()
-        )
-        
-        embed.add_field(
-            name="Cost",
-            value="**10 shards** - Unlock hero",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**10 shards**",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["unlock"], view=self)
     
     @discord.ui.button(label="1 Star", style=discord.ButtonStyle.primary)
     async def one_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 1 star information."""
-        embed = discord.Embed(
-            title="⭐ 1 Star (Level 1-10)",
-            description="Information for 1 star rankup",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**1 shard** - 1/5 star\n**1 shard** - 2/5 star\n**1 shard** - 3/5 star\n**2 shards** - 4/5 star\n**3 shards** - Complete 1 star",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**18 shards** (10 unlock + 8 for 1 star)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["1"], view=self)
     
     @discord.ui.button(label="2 Stars", style=discord.ButtonStyle.primary)
     async def two_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 2 star information."""
-        embed = discord.Embed(
-            title="⭐ 2 Stars (Level 20)",
-            description="Information for 2 star rankup",
-            color=discord.Color.purple()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**3 shards** - 1+1/5 star\n**3 shards** - 1+2/5 star\n**3 shards** - 1+3/5 star\n**5 shards** - 1+4/5 star\n**8 shards** - Complete 2 stars",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**40 shards** (10 unlock + 8 for 1 star + 22 for 2 stars)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["2"], view=self)
     
     @discord.ui.button(label="3 Stars", style=discord.ButtonStyle.primary)
     async def three_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 3 star information."""
-        embed = discord.Embed(
-            title="⭐ 3 Stars (Level 30)",
-            description="Information for 3 star rankup",
-            color=discord.Color.orange()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**8 shards** - 2+1/5 star\n**8 shards** - 2+2/5 star\n**8 shards** - 2+3/5 star\n**12 shards** - 2+4/5 star\n**20 shards** - Complete 3 stars",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**96 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["3"], view=self)
     
     @discord.ui.button(label="4 Stars", style=discord.ButtonStyle.primary)
     async def four_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 4 star information."""
-        embed = discord.Embed(
-            title="⭐ 4 Stars (Level 40)",
-            description="Information for 4 star rankup",
-            color=discord.Color.red()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**20 shards** - 3+1/5 star\n**20 shards** - 3+2/5 star\n**20 shards** - 3+3/5 star\n**30 shards** - 3+4/5 star\n**50 shards** - Complete 4 stars",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**236 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["4"], view=self)
     
     @discord.ui.button(label="5 Stars", style=discord.ButtonStyle.primary)
     async def five_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 5 star information."""
-        embed = discord.Embed(
-            title="⭐ 5 Stars (Level 50)",
-            description="Information for 5 star rankup",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**50 shards** - 4+1/5 star\n**50 shards** - 4+2/5 star\n**50 shards** - 4+3/5 star\n**60 shards** - 4+4/5 star\n**80 shards** - Complete 5 stars",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**526 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars + 290 for 5 stars)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["5"], view=self)
     
     @discord.ui.button(label="6 Stars", style=discord.ButtonStyle.primary)
     async def six_star_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show 6 star information."""
-        embed = discord.Embed(
-            title="⭐ 6 Stars (Level 60)",
-            description="Information for 6 star rankup",
-            color=discord.Color.dark_purple()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="**140 shards** - Complete 6 stars",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="Total Shards Used",
-            value="**966 shards** (10 unlock + 8 for 1 star + 22 for 2 stars + 56 for 3 stars + 140 for 4 stars + 290 for 5 stars + 140 for 6 stars)",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["6"], view=self)
     
     @discord.ui.button(label="💰 Total Cost", style=discord.ButtonStyle.success)
     async def total_cost_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show total cost information."""
-        embed = discord.Embed(
-            title="💰 Total Hero Rankup Cost",
-            description="Complete cost breakdown from unlock to 6 stars",
-            color=discord.Color.dark_green()
-        )
-        
-        embed.add_field(
-            name="Cost Breakdown",
-            value="🔓 **Unlock**: 10 shards\n⭐ **1 Star**: 18 shards\n⭐⭐ **2 Stars**: 40 shards\n⭐⭐⭐ **3 Stars**: 96 shards\n⭐⭐⭐⭐ **4 Stars**: 236 shards\n⭐⭐⭐⭐⭐ **5 Stars**: 526 shards\n⭐⭐⭐⭐⭐⭐ **6 Stars**: 966 shards",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Total Cost",
-            value="**966 Spirit Shards** - Total cost from unlock to 6 stars",
-            inline=False
-        )
-        
-        embed.set_footer(text="Information Provided and Processed by Kuvira (@archfiends)")
-        
-        await interaction.response.edit_message(embed=embed, view=self) 
\ No newline at end of file
+        await interaction.response.edit_message(embed=_RANKUP_EMBEDS["total"], view=self)
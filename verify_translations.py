@@ -7,153 +7,262 @@ This script verifies that all translation keys have translations for all 3 langu
 """
 
 import json
+import mmap
+import os
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 
-def load_translation_module(module_path: Path) -> Dict[str, Dict[str, str]]:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped for orjson instead of read into a copy
+_MMAP_THRESHOLD = 64 * 1024
+
+def _load_json(path: Union[str, Path]) -> Any:
+    """Parse a UTF-8 JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+        return json.load(f)
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Languages every translation module must provide
+_EXPECTED_LANGUAGES = frozenset({"EN", "DE", "ES"})
+
+# Parsed translation modules by resolved path, so each file is decoded at most once
+_MODULE_CACHE: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+def load_translation_module(module_path: Union[str, Path]) -> Dict[str, Dict[str, str]]:
     """Load a translation module file."""
+    key = os.path.realpath(module_path)
+    if key in _MODULE_CACHE:
+        return _MODULE_CACHE[key]
     try:
-        with open(module_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        translations = _load_json(module_path)
+        _MODULE_CACHE[key] = translations
+        return translations
     except Exception as e:
-        print(f"❌ Error loading {module_path}: {e}")
+        print(f"❌ Error loading {module_path}: {e}", file=sys.stderr)
         return {}
 
-def verify_module_translations(module_name: str, translations: Dict[str, Dict[str, str]]) -> Dict[str, List[str]]:
+# Below this many module files, importing asyncio costs more than overlapping the reads saves
+_PREFETCH_MIN_MODULES = 64
+
+def _prefetch_modules(module_paths: List[str]):
+    """Read and parse module files concurrently into the module cache."""
+    try:
+        import aiofiles
+    except ImportError:
+        return
+    import asyncio
+    
+    async def prefetch(module_path: str):
+        async with aiofiles.open(module_path, 'rb') as f:
+            data = await f.read()
+        loop = asyncio.get_running_loop()
+        _MODULE_CACHE[os.path.realpath(module_path)] = await loop.run_in_executor(None, _loads, data)
+    
+    async def prefetch_all():
+        # Failures stay uncached; load_translation_module retries and reports them
+        await asyncio.gather(*(prefetch(path) for path in module_paths), return_exceptions=True)
+    
+    asyncio.run(prefetch_all())
+
+# Number of sample issues shown per issue type
+_SAMPLE_LIMIT = 3
+
+class Issues:
+    """Count of one issue type plus the first few samples for the report.
+    
+    Samples are kept as raw parts (e.g. language, key) and only joined when printed.
+    """
+    
+    __slots__ = ("count", "samples")
+    
+    def __init__(self):
+        self.count = 0
+        self.samples: List[Tuple[str, ...]] = []
+    
+    def __bool__(self) -> bool:
+        return self.count > 0
+    
+    def add(self, sample: Tuple[str, ...]):
+        """Record one issue."""
+        self.count += 1
+        if len(self.samples) < _SAMPLE_LIMIT:
+            self.samples.append(sample)
+    
+    def extend(self, count: int, samples: Iterable[Tuple[str, ...]]):
+        """Record count issues; only as many samples as fit are consumed."""
+        self.count += count
+        self.samples.extend(islice(samples, _SAMPLE_LIMIT - len(self.samples)))
+
+def verify_module_translations(module_name: str, translations: Dict[str, Dict[str, str]]) -> Dict[str, Issues]:
     """Verify that all keys have translations for all 3 languages."""
+    missing_languages_out = Issues()
+    missing_keys_out = Issues()
+    empty_out = Issues()
     issues = {
-        "missing_languages": [],
-        "missing_keys": [],
-        "empty_translations": []
+        "missing_languages": missing_languages_out,
+        "missing_keys": missing_keys_out,
+        "empty_translations": empty_out
     }
     
     if not translations:
-        issues["missing_keys"].append("No translations found")
+        missing_keys_out.add(("No translations found",))
         return issues
     
-    # Get all unique keys from all languages
-    all_keys = set()
-    for language, lang_translations in translations.items():
-        all_keys.update(lang_translations.keys())
-    
-    # Check each language has all keys
-    expected_languages = {"EN", "DE", "ES"}
-    found_languages = set(translations.keys())
-    
     # Check for missing languages
-    missing_languages = expected_languages - found_languages
+    missing_languages = _EXPECTED_LANGUAGES - translations.keys()
     if missing_languages:
-        issues["missing_languages"].extend(list(missing_languages))
+        missing_languages_out.extend(len(missing_languages), ((language,) for language in missing_languages))
+        # With no expected language present, per-key comparisons would only be noise
+        if len(missing_languages) == len(_EXPECTED_LANGUAGES):
+            return issues
     
-    # Check each language has all keys
-    for language in found_languages:
-        lang_keys = set(translations[language].keys())
-        missing_keys = all_keys - lang_keys
-        if missing_keys:
-            issues["missing_keys"].extend([f"{language}: {key}" for key in missing_keys])
+    # Get all unique keys from all languages
+    all_keys = set().union(*(lang_translations.keys() for lang_translations in translations.values()))
     
-    # Check for empty translations
+    # Check each language has all keys (set difference against the dict's keys view)
+    # and no empty translations, in one pass per language
+    add_empty = empty_out.add
     for language, lang_translations in translations.items():
+        missing_keys = all_keys - lang_translations.keys()
+        if missing_keys:
+            missing_keys_out.extend(len(missing_keys), ((language, key) for key in missing_keys))
+        
         for key, value in lang_translations.items():
-            if not value or value.strip() == "":
-                issues["empty_translations"].append(f"{language}: {key}")
+            if not value or (isinstance(value, str) and not value.strip()):
+                add_empty((language, key))
     
     return issues
 
 def main():
     """Main verification function."""
-    print("🔍 Translation Verification Script")
-    print("=" * 50)
-    
-    translations_path = Path("data/translations")
-    if not translations_path.exists():
-        print("❌ Translations folder not found!")
-        return
-    
-    # Load main index
-    index_path = translations_path / "index" / "main_index.json"
-    if not index_path.exists():
-        print("❌ Main index not found!")
-        return
-    
-    with open(index_path, 'r', encoding='utf-8') as f:
-        index = json.load(f)
-    
-    total_issues = 0
-    modules_with_issues = []
-    
-    print(f"📋 Checking {len(index['modules'])} modules...")
-    print()
-    
-    for module_name, module_info in index["modules"].items():
-        print(f"🔍 Checking {module_name}...")
+    # Output is collected and written in one go at the end
+    out: List[str] = []
+    try:
+        out.append("🔍 Translation Verification Script")
+        out.append("=" * 50)
         
-        # Load module translations
-        module_file = translations_path / module_info["file_path"]
-        translations = load_translation_module(module_file)
+        translations_path = Path("data/translations")
+        if not translations_path.exists():
+            out.append("❌ Translations folder not found!")
+            return
         
-        # Verify translations
-        issues = verify_module_translations(module_name, translations)
+        # Load main index
+        index_path = translations_path / "index" / "main_index.json"
+        if not index_path.exists():
+            out.append("❌ Main index not found!")
+            return
         
-        # Report issues
-        has_issues = False
-        for issue_type, issue_list in issues.items():
-            if issue_list:
-                has_issues = True
-                total_issues += len(issue_list)
-                print(f"  ❌ {issue_type}: {len(issue_list)} issues")
-                for issue in issue_list[:3]:  # Show first 3 issues
-                    print(f"    - {issue}")
-                if len(issue_list) > 3:
-                    print(f"    ... and {len(issue_list) - 3} more")
+        index = _load_json(index_path)
         
-        if has_issues:
-            modules_with_issues.append(module_name)
-        else:
-            print(f"  ✅ All translations complete")
+        total_issues = 0
+        modules_with_issues = []
+        # Verification results by module file, reused by the command descriptions check
+        results: Dict[str, Dict[str, Issues]] = {}
         
-        print()
-    
-    # Summary
-    print("📊 VERIFICATION SUMMARY")
-    print("=" * 30)
-    print(f"Total modules checked: {len(index['modules'])}")
-    print(f"Modules with issues: {len(modules_with_issues)}")
-    print(f"Total issues found: {total_issues}")
-    
-    if modules_with_issues:
-        print(f"\n❌ Modules with issues:")
-        for module in modules_with_issues:
-            print(f"  - {module}")
-    else:
-        print("\n🎉 All translations are complete for all 3 languages!")
-    
-    # Check specific command descriptions
-    print(f"\n🔍 Detailed Command Descriptions Check:")
-    cmd_desc_file = translations_path / "command_descriptions" / "translations.json"
-    cmd_translations = load_translation_module(cmd_desc_file)
-    
-    if cmd_translations:
-        cmd_issues = verify_module_translations("command_descriptions", cmd_translations)
-        if any(cmd_issues.values()):
-            print("❌ Command descriptions have issues:")
-            for issue_type, issue_list in cmd_issues.items():
+        # Module paths are joined as plain strings; no Path objects per module
+        base = os.fspath(translations_path)
+        
+        module_files = {
+            module_name: os.path.join(base, module_info["file_path"])
+            for module_name, module_info in index["modules"].items()
+        }
+        cmd_desc_file = os.path.join(base, "command_descriptions", "translations.json")
+        
+        # For large indexes, overlap the file reads up front; the checks below then hit the module cache
+        if len(module_files) >= _PREFETCH_MIN_MODULES:
+            _prefetch_modules([*module_files.values(), cmd_desc_file])
+        
+        out.append(f"📋 Checking {len(index['modules'])} modules...")
+        out.append("")
+        
+        for module_name, module_file in module_files.items():
+            out.append(f"🔍 Checking {module_name}...")
+            
+            # Load module translations
+            translations = load_translation_module(module_file)
+            
+            # Verify translations
+            issues = verify_module_translations(module_name, translations)
+            results[module_file] = issues
+            
+            # Report issues
+            has_issues = False
+            for issue_type, issue_list in issues.items():
                 if issue_list:
-                    print(f"  - {issue_type}: {len(issue_list)} issues")
+                    has_issues = True
+                    total_issues += issue_list.count
+                    out.append(f"  ❌ {issue_type}: {issue_list.count} issues")
+                    for issue in issue_list.samples:  # Show first 3 issues
+                        out.append(f"    - {': '.join(issue)}")
+                    if issue_list.count > _SAMPLE_LIMIT:
+                        out.append(f"    ... and {issue_list.count - _SAMPLE_LIMIT} more")
+            
+            if has_issues:
+                modules_with_issues.append(module_name)
+            else:
+                out.append(f"  ✅ All translations complete")
+            
+            out.append("")
+        
+        # Summary
+        out.append("📊 VERIFICATION SUMMARY")
+        out.append("=" * 30)
+        out.append(f"Total modules checked: {len(index['modules'])}")
+        out.append(f"Modules with issues: {len(modules_with_issues)}")
+        out.append(f"Total issues found: {total_issues}")
+        
+        if modules_with_issues:
+            out.append(f"\n❌ Modules with issues:")
+            for module in modules_with_issues:
+                out.append(f"  - {module}")
         else:
-            print("✅ All command descriptions are complete!")
-    
-    print(f"\n📋 Next steps:")
-    if total_issues > 0:
-        print("1. Fix missing translations in the modules listed above")
-        print("2. Ensure all keys have translations for EN, DE, and ES")
-        print("3. Remove any empty translation values")
-        print("4. Re-run this verification script")
-    else:
-        print("1. All translations are complete!")
-        print("2. Your bot is ready for multilingual support")
-        print("3. Users can use /language to switch between EN, DE, ES")
+            out.append("\n🎉 All translations are complete for all 3 languages!")
+        
+        # Check specific command descriptions
+        out.append(f"\n🔍 Detailed Command Descriptions Check:")
+        cmd_translations = load_translation_module(cmd_desc_file)
+        
+        if cmd_translations:
+            cmd_issues = results.get(cmd_desc_file)
+            if cmd_issues is None:
+                cmd_issues = verify_module_translations("command_descriptions", cmd_translations)
+            if any(cmd_issues.values()):
+                out.append("❌ Command descriptions have issues:")
+                for issue_type, issue_list in cmd_issues.items():
+                    if issue_list:
+                        out.append(f"  - {issue_type}: {issue_list.count} issues")
+            else:
+                out.append("✅ All command descriptions are complete!")
+        
+        out.append(f"\n📋 Next steps:")
+        if total_issues > 0:
+            out.append("1. Fix missing translations in the modules listed above")
+            out.append("2. Ensure all keys have translations for EN, DE, and ES")
+            out.append("3. Remove any empty translation values")
+            out.append("4. Re-run this verification script")
+        else:
+            out.append("1. All translations are complete!")
+            out.append("2. Your bot is ready for multilingual support")
+            out.append("3. Users can use /language to switch between EN, DE, ES")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()